@@ -0,0 +1,17 @@
+#!/usr/bin/env sh
+# Serve the API with the C event loop and HTTP parser. uvicorn
+# auto-detects uvloop/httptools when installed; the flags pin them so a
+# broken install fails loudly instead of silently falling back to the
+# slower pure-Python implementations.
+#
+# WORKERS defaults to the machine's CPU count; override for containers
+# with a smaller CPU quota.
+set -e
+cd "$(dirname "$0")/.."
+WORKERS="${WORKERS:-$(python -c 'import os; print(os.cpu_count() or 1)')}"
+exec uvicorn src.api.main:app \
+  --host "${HOST:-0.0.0.0}" \
+  --port "${PORT:-8000}" \
+  --loop uvloop \
+  --http httptools \
+  --workers "$WORKERS"
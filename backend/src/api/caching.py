@@ -0,0 +1,62 @@
+"""HTTP response caching helpers (ETag + Cache-Control) for catalog GETs.
+
+Caches the serialized body and its ETag per cache key so a conditional
+GET hit skips Mongo and serialization entirely and becomes a header
+compare. blake3 is preferred for the hash; blake2b (stdlib, also
+tree-hash fast) is the fallback.
+"""
+
+from typing import Any, Optional
+
+import orjson
+from cachetools import TTLCache
+from fastapi import Request, Response
+
+try:
+    from blake3 import blake3 as _digest
+except ImportError:  # pragma: no cover - optional dependency
+    from hashlib import blake2b as _digest
+
+CACHE_CONTROL = "public, max-age=60"
+
+# slug-keyed (etag, body) pairs; the TTL bounds staleness if an
+# invalidation is ever missed (e.g. an edit from another process).
+_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=300)
+
+
+def _headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def _respond(request: Request, etag: str, body: bytes) -> Response:
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=_headers(etag))
+    return Response(
+        content=body, media_type="application/json", headers=_headers(etag)
+    )
+
+
+def cached_response(request: Request, key: str) -> Optional[Response]:
+    """Serve ``key`` from cache, or None on a miss."""
+    entry = _CACHE.get(key)
+    if entry is None:
+        return None
+    return _respond(request, *entry)
+
+
+def store_response(request: Request, key: str, payload: Any) -> Response:
+    """Serialize ``payload`` once, cache it under ``key`` and respond."""
+    body = orjson.dumps(payload)
+    etag = '"%s"' % _digest(body).hexdigest()
+    _CACHE[key] = (etag, body)
+    return _respond(request, etag, body)
+
+
+def invalidate(*keys: str) -> None:
+    for key in keys:
+        _CACHE.pop(key, None)
+
+
+def invalidate_prefix(prefix: str) -> None:
+    for key in [k for k in _CACHE if k.startswith(prefix)]:
+        _CACHE.pop(key, None)
@@ -0,0 +1,114 @@
+"""Shared FastAPI dependencies (database sessions, auth, repositories)."""
+
+import functools
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Dict
+
+import jwt
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from ..config import Config, get_config
+from .repositories import DEFAULT_REPO, InMemoryRepository
+
+_bearer_scheme = HTTPBearer(auto_error=False)
+
+_ASYNC_SESSION_FACTORY = None
+
+
+def _get_cached_async_factory():
+    global _ASYNC_SESSION_FACTORY
+    if _ASYNC_SESSION_FACTORY is None:
+        from ..db.sqlalchemy import get_async_session_factory
+
+        _ASYNC_SESSION_FACTORY = get_async_session_factory()
+    return _ASYNC_SESSION_FACTORY
+
+
+async def get_async_db():
+    """Yield an AsyncSession; queries await instead of blocking the loop."""
+    async with _get_cached_async_factory()() as db:
+        yield db
+
+
+def get_repository_dep() -> InMemoryRepository:
+    """Return the default in-memory repository."""
+    return DEFAULT_REPO
+
+
+def get_config_dep() -> Config:
+    return get_config()
+
+
+@functools.lru_cache(maxsize=1)
+def get_jwt_secret() -> str:
+    # Read once per process; call get_jwt_secret.cache_clear() after a
+    # secret rotation.
+    return os.getenv("JWT_SECRET", "dev-secret-change-me")
+
+
+_PUBLIC_KEY = None
+_PUBLIC_KEY_LOADED = False
+
+
+def _get_jwt_public_key():
+    """Load the RS256 verification key from JWT_PUBLIC_KEY (PEM) once.
+
+    Returns a `cryptography` key object so PyJWT skips PEM parsing on every
+    decode; None when no public key is configured (HS256 dev fallback).
+    """
+    global _PUBLIC_KEY, _PUBLIC_KEY_LOADED
+    if not _PUBLIC_KEY_LOADED:
+        pem = os.getenv("JWT_PUBLIC_KEY")
+        if pem:
+            from cryptography.hazmat.primitives import serialization
+
+            _PUBLIC_KEY = serialization.load_pem_public_key(pem.encode())
+        _PUBLIC_KEY_LOADED = True
+    return _PUBLIC_KEY
+
+
+def _decode_token(token: str) -> Dict[str, Any]:
+    public_key = _get_jwt_public_key()
+    if public_key is not None:
+        return jwt.decode(token, public_key, algorithms=["RS256"])
+    return jwt.decode(token, get_jwt_secret(), algorithms=["HS256"])
+
+
+# Decoded-claims cache keyed by token digest. Bearer tokens are reused for
+# minutes at a time, so most admin requests skip signature verification.
+# Only successfully verified tokens are ever cached.
+_TOKEN_CACHE: "TTLCache[bytes, Dict[str, Any]]" = TTLCache(maxsize=4096, ttl=300)
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+def require_admin(
+    credentials: HTTPAuthorizationCredentials = Depends(_bearer_scheme),
+) -> Dict[str, Any]:
+    """Validate the bearer token and require an admin role claim."""
+    if credentials is None:
+        raise HTTPException(status_code=401, detail="Missing bearer token")
+    token = credentials.credentials
+    key = hashlib.sha256(token.encode()).digest()
+    with _TOKEN_CACHE_LOCK:
+        payload = _TOKEN_CACHE.get(key)
+    if payload is not None:
+        # TTLCache bounds staleness, but still honor an exp inside the window.
+        exp = payload.get("exp")
+        if exp is None or exp > time.time():
+            if payload.get("role") != "admin":
+                raise HTTPException(status_code=403, detail="Admin role required")
+            return payload
+    try:
+        payload = _decode_token(token)
+    except jwt.PyJWTError:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE[key] = payload
+    if payload.get("role") != "admin":
+        raise HTTPException(status_code=403, detail="Admin role required")
+    return payload
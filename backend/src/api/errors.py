@@ -0,0 +1,92 @@
+"""Application error types and FastAPI exception handlers."""
+
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from fastapi import Request
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+class ErrorCode(str, Enum):
+    INTERNAL_ERROR = "INTERNAL_ERROR"
+    NOT_FOUND = "NOT_FOUND"
+    VALIDATION_ERROR = "VALIDATION_ERROR"
+    CONFLICT = "CONFLICT"
+    UNAUTHORIZED = "UNAUTHORIZED"
+    FORBIDDEN = "FORBIDDEN"
+
+
+class ErrorDetail(BaseModel):
+    """Error payload schema, kept for OpenAPI documentation.
+
+    The handlers below build plain dicts instead of instantiating this
+    model: the error path should not pay Pydantic validation.
+    """
+
+    code: ErrorCode
+    message: str
+    timestamp: str
+    details: Optional[Dict[str, Any]] = None
+
+
+class ApplicationError(Exception):
+    """Base class for errors that map to a well-formed HTTP response."""
+
+    def __init__(
+        self,
+        message: str,
+        code: ErrorCode = ErrorCode.INTERNAL_ERROR,
+        status_code: int = 500,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        super().__init__(message)
+        self.message = message
+        self.code = code
+        self.status_code = status_code
+        self.details = details
+        # Response payload built eagerly so the handler just wraps it.
+        self._payload = {
+            "code": code.value,
+            "message": message,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "details": details,
+        }
+
+    def to_model(self) -> ErrorDetail:
+        return ErrorDetail(
+            code=self.code,
+            message=self.message,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            details=self.details,
+        )
+
+
+async def application_error_handler(request: Request, exc: ApplicationError) -> ORJSONResponse:
+    return ORJSONResponse(status_code=exc.status_code, content={"error": exc._payload})
+
+
+async def generic_error_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    # Imported here so this module doesn't drag SQLAlchemy in at import
+    # time; the error path is cold and the module is cached after first use.
+    from sqlalchemy.exc import SQLAlchemyError
+
+    # Avoid stringifying the full exception: SQLAlchemy errors embed whole
+    # statements, so str(exc) can allocate tens of KB (and leak query text).
+    if isinstance(exc, SQLAlchemyError):
+        reason = type(exc).__name__
+    else:
+        msg = exc.args[0] if exc.args else type(exc).__name__
+        reason = (msg if isinstance(msg, str) else str(msg))[:200]
+    return ORJSONResponse(
+        status_code=500,
+        content={
+            "error": {
+                "code": ErrorCode.INTERNAL_ERROR.value,
+                "message": "An unexpected error occurred",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "details": {"reason": reason},
+            }
+        },
+    )
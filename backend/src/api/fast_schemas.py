@@ -0,0 +1,34 @@
+"""msgspec mirrors of the hot catalog payload schemas.
+
+msgspec decodes and validates nested struct arrays several times faster
+than Pydantic, so the admin create/update paths try these first and fall
+back to the Pydantic models when msgspec is unavailable or the payload
+does not decode. Keep the shapes in sync with ``schemas.py``.
+"""
+
+from typing import List, Optional
+
+import msgspec
+
+
+class QuizQuestion(msgspec.Struct):
+    question: str
+    options: List[str]
+    answerIndex: int = 0
+
+
+class LessonPayload(msgspec.Struct):
+    title: str
+    slug: str
+    skillSlug: str
+    order: int = 1
+    content: Optional[str] = None
+    tags: List[str] = []
+    quiz: Optional[List[QuizQuestion]] = None
+
+
+lesson_decoder = msgspec.json.Decoder(LessonPayload)
+
+
+def lesson_to_doc(payload: LessonPayload) -> dict:
+    return msgspec.to_builtins(payload)
@@ -0,0 +1,36 @@
+"""Dump the application's OpenAPI schema to a JSON file.
+
+Run from the backend directory with ``python -m src.api.generate_openapi``.
+Pass ``--pretty`` for an indented, human-readable file.
+"""
+
+import os
+import sys
+
+import orjson
+
+from .main import app
+
+
+def generate_openapi_to_file(output_path: str = "openapi.json", pretty: bool = False) -> str:
+    """Write the (cached) OpenAPI schema to ``output_path`` and return it."""
+    # app.openapi() caches on app.openapi_schema, so repeated calls within
+    # one process reuse the same dict.
+    openapi_schema = app.openapi()
+    data = orjson.dumps(openapi_schema, option=orjson.OPT_INDENT_2 if pretty else 0)
+    # Write to a sibling tmp file and rename atomically so readers never
+    # observe a half-written schema.
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if a != "--pretty"]
+    path = args[0] if args else "openapi.json"
+    print(
+        "Wrote OpenAPI schema to "
+        f"{generate_openapi_to_file(path, pretty='--pretty' in sys.argv[1:])}"
+    )
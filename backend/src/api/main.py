@@ -0,0 +1,217 @@
+"""FastAPI application entrypoint for the SkillMaster learning platform."""
+
+import asyncio
+import logging
+import os
+import re
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, Response
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse
+
+from .dependencies import require_admin
+from .errors import (
+    ApplicationError,
+    ErrorCode,
+    application_error_handler,
+    generic_error_handler,
+)
+from .repositories import DEFAULT_REPO
+from .routers import catalog as catalog_router
+from .routers import lessons as lessons_router
+from .routers import progress as progress_router
+from .routers import progress_relational as progress_relational_router
+from .routers import quiz_ai as quiz_ai_router
+from .routers import relational as relational_router
+from .routers import skill_progressive as skill_progressive_router
+from .routers import skills as skills_router
+
+logger = logging.getLogger(__name__)
+
+# The db drivers (SQLAlchemy, Motor) and the seeders are imported inside
+# the functions that need them: importing src.api.main stays cheap for
+# tooling such as generate_openapi and --reload restarts.
+
+
+async def _create_tables_safe() -> None:
+    from ..db.sqlalchemy import create_all_tables
+
+    try:
+        await create_all_tables()
+    except Exception:
+        logger.warning("Relational database unavailable at startup")
+
+
+def _warm_pydantic_schemas() -> None:
+    # pydantic-core builds each model's core schema lazily, so the first
+    # request hitting a model pays a one-off build cost. Force the builds
+    # (and one throwaway validation to warm pydantic-core's caches) at
+    # startup so p99 latency doesn't include them.
+    from .relational_schemas import (
+        ActivityRead,
+        LessonRead,
+        ModuleRead,
+        ProgressRead,
+        SubjectRead,
+    )
+    from .schemas import LessonModel, QuizQuestionModel, SkillModel
+
+    for model in (
+        SkillModel,
+        LessonModel,
+        QuizQuestionModel,
+        SubjectRead,
+        ModuleRead,
+        LessonRead,
+        ActivityRead,
+        ProgressRead,
+    ):
+        model.model_rebuild(force=True)
+    SkillModel.model_validate(
+        {"slug": "warmup", "name": "Warmup", "category": "General"}
+    )
+
+
+async def _init_mongo_safe(app: FastAPI) -> None:
+    from ..db.mongo import get_mongo_db, init_mongo
+    from ..db.mongo_catalog import MongoCatalogRepository
+
+    app.state.catalog_repo = None
+    try:
+        await init_mongo()
+        # One repository per process; ensure_indexes issues its
+        # createIndexes round-trip here instead of on every request.
+        repo = MongoCatalogRepository(get_mongo_db())
+        await repo.ensure_indexes()
+        app.state.catalog_repo = repo
+    except Exception:
+        logger.warning("Mongo unavailable at startup; catalog endpoints degraded")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Mongo init and table creation are independent and network-bound, so
+    # run them concurrently instead of one await at a time.
+    _warm_pydantic_schemas()
+    await asyncio.gather(_init_mongo_safe(app), _create_tables_safe())
+    if os.getenv("SEED_ON_STARTUP", "").lower() == "true":
+        from ..seeds import run_all_seeds
+
+        await asyncio.to_thread(run_all_seeds)
+    # Build the OpenAPI schema once per process so /openapi.json, /docs and
+    # /redoc serve the cached dict instead of re-walking every route.
+    app.openapi_schema = app.openapi()
+    yield
+    from ..db.mongo import close_mongo
+
+    await close_mongo()
+
+
+app = FastAPI(
+    title="SkillMaster Learning Platform API",
+    description="Backend API for browsing skills, lessons and learner progress.",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+app.add_exception_handler(ApplicationError, application_error_handler)
+app.add_exception_handler(Exception, generic_error_handler)
+
+
+_raw_origins = os.getenv("CORS_ALLOW_ORIGINS", "").split(",") + [
+    os.getenv("FRONTEND_URL", "http://localhost:3000")
+]
+allow_origins = sorted({o.rstrip("/") for o in _raw_origins if o})
+# Starlette scans the allow_origins list in Python per request; a single
+# anchored alternation compiled once gets that down to one C-level regex
+# match (preflights included). "*" keeps the middleware's own wildcard
+# early-exit instead.
+if "*" in allow_origins:
+    _cors_kwargs = {"allow_origins": ["*"]}
+else:
+    _cors_kwargs = {
+        "allow_origin_regex": "^(?:%s)$"
+        % "|".join(re.escape(o) for o in allow_origins)
+    }
+app.add_middleware(
+    CORSMiddleware,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+    **_cors_kwargs,
+)
+# Cached for the health endpoint; avoids walking Starlette's middleware
+# list on every liveness probe.
+app.state.cors_allow_origins = allow_origins
+
+app.include_router(catalog_router.router)
+app.include_router(lessons_router.router)
+app.include_router(progress_router.router)
+app.include_router(progress_relational_router.router)
+app.include_router(quiz_ai_router.router)
+app.include_router(relational_router.router)
+app.include_router(skills_router.router)
+app.include_router(skill_progressive_router.router)
+
+app.state.repositories = {"default": DEFAULT_REPO}
+
+# Environment is fixed for the lifetime of the process; read these once
+# instead of per request in the handlers below.
+_FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
+_BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
+
+# The help page is fully static, so render and encode it once at import.
+_HELP_HTML_BYTES = f"""
+<html>
+  <head><title>SkillMaster Backend</title></head>
+  <body>
+    <h1>SkillMaster Learning Platform — Backend</h1>
+    <p>This service exposes the REST API for the SkillMaster frontend.</p>
+    <ul>
+      <li>Interactive docs: <a href="{_BACKEND_URL}/docs">{_BACKEND_URL}/docs</a></li>
+      <li>OpenAPI schema: <a href="{_BACKEND_URL}/openapi.json">{_BACKEND_URL}/openapi.json</a></li>
+      <li>Frontend: <a href="{_FRONTEND_URL}">{_FRONTEND_URL}</a></li>
+    </ul>
+  </body>
+</html>
+""".encode("utf-8")
+
+
+@app.get("/", tags=["health"])
+async def health_check():
+    return {
+        "status": "healthy",
+        "service": "skillmaster-backend",
+        "cors": {
+            "allow_origins": app.state.cors_allow_origins,
+            "allow_credentials": True,
+        },
+    }
+
+
+@app.get("/help", response_class=HTMLResponse, tags=["help"])
+async def backend_help():
+    # Pre-encoded bytes: no f-string interpolation and no str->bytes
+    # encoding per request.
+    return Response(content=_HELP_HTML_BYTES, media_type="text/html")
+
+
+@app.post("/admin/seed", tags=["admin"])
+async def run_seeds_endpoint(claims: dict = Depends(require_admin)):
+    from ..seeds import run_all_seeds
+
+    # Seeds run in a worker thread so a slow Mongo round-trip can't pin a
+    # threadpool slot for the whole request; bound it so a stuck seed
+    # can't hold the thread forever. Seeding is idempotent, so a timeout
+    # retry is safe.
+    try:
+        await asyncio.wait_for(asyncio.to_thread(run_all_seeds), timeout=60)
+    except asyncio.TimeoutError:
+        raise ApplicationError(
+            "Seeding timed out after 60s",
+            code=ErrorCode.INTERNAL_ERROR,
+            status_code=504,
+        )
+    return {"ok": True, "message": "Seeds completed"}
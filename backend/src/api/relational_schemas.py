@@ -0,0 +1,304 @@
+"""Pydantic schemas for the relational content hierarchy.
+
+Subject -> Module -> Lesson -> Activity, plus the Skill and Progress
+shapes shared by the catalog and progress routers.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+from ..db.models import ActivityType
+
+_ALLOWED_LEVELS = frozenset({"Beginner", "Intermediate", "Advanced"})
+_ALLOWED_ACTIVITY_TYPES = frozenset({"content", "quiz"})
+# Activity.type is stored as a small integer (see db.models.ActivityType)
+# but the API keeps the string names; read schemas translate on the way
+# out and the write path maps names back to codes.
+_ACTIVITY_TYPE_NAMES = {int(t): t.name.lower() for t in ActivityType}
+
+
+class _BaseSchema(BaseModel):
+    # True slotted models aren't available in pydantic v2 — field values
+    # live in the pydantic-core managed ``__dict__`` — but an empty
+    # ``__slots__`` keeps subclasses from growing per-instance storage
+    # for stray non-field attributes, and ``extra="ignore"`` (the
+    # default, made explicit) keeps unknown input keys out of instances.
+    __slots__ = ()
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class ActivityRead(_BaseSchema):
+    id: Optional[int] = None
+    lesson_id: Optional[int] = None
+    slug: Optional[str] = None
+    title: str
+    type: str = "content"
+    order_index: int = 0
+    content: Optional[str] = None
+    quiz_questions: Optional[List[Dict[str, Any]]] = None
+    quiz_pass_score: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @field_validator("type", mode="before")
+    @classmethod
+    def _type_name(cls, v):
+        if isinstance(v, int):
+            return _ACTIVITY_TYPE_NAMES.get(v, v)
+        return v
+
+
+class ActivitySummary(_BaseSchema):
+    """List-endpoint projection of an activity.
+
+    Omits ``content`` and ``quiz_questions`` — list clients render
+    titles, and those columns dominate row size.
+    """
+
+    id: Optional[int] = None
+    lesson_id: Optional[int] = None
+    title: str
+    type: str = "content"
+    order_index: int = 0
+    quiz_pass_score: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @field_validator("type", mode="before")
+    @classmethod
+    def _type_name(cls, v):
+        if isinstance(v, int):
+            return _ACTIVITY_TYPE_NAMES.get(v, v)
+        return v
+
+
+class LessonRead(_BaseSchema):
+    id: Optional[int] = None
+    module_id: Optional[int] = None
+    slug: str
+    title: str
+    content: Optional[str] = None
+    order_index: int = 0
+    activities: List[ActivityRead] = []
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class LessonSummary(_BaseSchema):
+    """List-endpoint projection of a lesson, without ``content``."""
+
+    id: Optional[int] = None
+    module_id: Optional[int] = None
+    slug: str
+    title: str
+    order_index: int = 0
+    activities: List[ActivitySummary] = []
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class ModuleRead(_BaseSchema):
+    id: Optional[int] = None
+    subject_id: Optional[int] = None
+    slug: str
+    title: str
+    description: Optional[str] = None
+    order_index: int = 0
+    lessons: List[LessonRead] = []
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class SubjectRead(_BaseSchema):
+    id: Optional[int] = None
+    slug: str
+    title: str
+    description: Optional[str] = None
+    modules: List[ModuleRead] = []
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class SkillRead(_BaseSchema):
+    id: Optional[int] = None
+    slug: str
+    name: str
+    category: Optional[str] = None
+    level: Optional[str] = None
+    description: Optional[str] = None
+    tags: List[str] = []
+    created_at: Optional[datetime] = None
+
+
+class SubjectCreate(_BaseSchema):
+    slug: str
+    title: str
+    description: Optional[str] = None
+
+
+class ModuleCreate(_BaseSchema):
+    subject_id: int
+    slug: str
+    title: str
+    description: Optional[str] = None
+    order_index: int = 0
+
+
+class LessonCreate(_BaseSchema):
+    module_id: int
+    slug: str
+    title: str
+    content: Optional[str] = None
+    order_index: int = 0
+
+
+class SkillCreate(_BaseSchema):
+    slug: str
+    name: str
+    category: Optional[str] = None
+    level: str = "Beginner"
+    description: Optional[str] = None
+    tags: List[str] = []
+
+    @field_validator("level")
+    @classmethod
+    def validate_level(cls, v: str) -> str:
+        if v not in _ALLOWED_LEVELS:
+            raise ValueError(f"level must be one of {sorted(_ALLOWED_LEVELS)}")
+        return v
+
+
+class SkillUpdate(_BaseSchema):
+    """Partial skill update; only fields the client sent are applied."""
+
+    name: Optional[str] = None
+    category: Optional[str] = None
+    level: Optional[str] = None
+    description: Optional[str] = None
+    tags: Optional[List[str]] = None
+
+    @field_validator("level")
+    @classmethod
+    def validate_level(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None and v not in _ALLOWED_LEVELS:
+            raise ValueError(f"level must be one of {sorted(_ALLOWED_LEVELS)}")
+        return v
+
+
+class SubjectUpdate(_BaseSchema):
+    """Partial subject update; only fields the client sent are applied."""
+
+    title: Optional[str] = None
+    description: Optional[str] = None
+
+
+class ModuleUpdate(_BaseSchema):
+    subject_id: Optional[int] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    order_index: Optional[int] = None
+
+
+class LessonUpdate(_BaseSchema):
+    module_id: Optional[int] = None
+    title: Optional[str] = None
+    content: Optional[str] = None
+    order_index: Optional[int] = None
+
+
+class ActivityUpdate(_BaseSchema):
+    title: Optional[str] = None
+    type: Optional[str] = None
+    order_index: Optional[int] = None
+    content: Optional[str] = None
+    quiz_questions: Optional[List[Dict[str, Any]]] = None
+    quiz_pass_score: Optional[int] = None
+
+    @field_validator("type")
+    @classmethod
+    def validate_type(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None and v not in _ALLOWED_ACTIVITY_TYPES:
+            raise ValueError("type must be 'content' or 'quiz'")
+        return v
+
+
+class ActivityCreate(_BaseSchema):
+    lesson_id: int
+    title: str
+    type: str = "content"
+    order_index: int = 0
+    content: Optional[str] = None
+    quiz_questions: Optional[List[Dict[str, Any]]] = None
+    quiz_pass_score: Optional[int] = None
+
+    @field_validator("type")
+    @classmethod
+    def validate_type(cls, v: str) -> str:
+        if v not in _ALLOWED_ACTIVITY_TYPES:
+            raise ValueError("type must be 'content' or 'quiz'")
+        return v
+
+    @field_validator("quiz_questions")
+    @classmethod
+    def validate_quiz(cls, v):
+        if v is not None:
+            for q in v:
+                if "question" not in q or "options" not in q:
+                    raise ValueError("each quiz question needs 'question' and 'options'")
+        return v
+
+
+T = TypeVar("T")
+
+
+class Page(_BaseSchema, Generic[T]):
+    """One keyset page of results; next_cursor is None on the last page."""
+
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+_ALLOWED_PROGRESS_STATUSES = frozenset(
+    {"in_progress", "attempted", "completed", "unlocked"}
+)
+
+
+class ProgressUpsert(_BaseSchema):
+    user_id: str
+    lesson_id: Optional[int] = None
+    activity_id: Optional[int] = None
+    status: str = "in_progress"
+    score: Optional[float] = None
+
+    @field_validator("status")
+    @classmethod
+    def validate_status(cls, v: str) -> str:
+        if v not in _ALLOWED_PROGRESS_STATUSES:
+            raise ValueError(
+                f"status must be one of {sorted(_ALLOWED_PROGRESS_STATUSES)}"
+            )
+        return v
+
+
+class ProgressEntryRead(_BaseSchema):
+    """A relational progress state row (one per user/lesson/activity)."""
+
+    id: Optional[int] = None
+    user_id: str
+    lesson_id: Optional[int] = None
+    activity_id: Optional[int] = None
+    status: str = "in_progress"
+    score: Optional[float] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class ProgressRead(_BaseSchema):
+    user_id: str
+    lesson_slug: Optional[str] = None
+    status: str = "in_progress"
+    score: Optional[float] = None
+    recorded_at: Optional[datetime] = None
@@ -0,0 +1,77 @@
+"""In-memory repository used by the prototype lesson/progress endpoints."""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+
+class InMemoryRepository:
+    """Process-local structure-of-arrays store for lessons and progress.
+
+    The filter keys (lesson slug, user id, lesson slug per progress
+    event) live in parallel columns scanned without touching the full
+    record dicts, so filter loops stay inside a few contiguous lists and
+    only matching rows are materialized. Slug lookup goes through a dict
+    index in O(1).
+    """
+
+    def __init__(self) -> None:
+        # lessons: slug column + records, with a slug -> row index.
+        self._lesson_slugs: List[str] = []
+        self._lesson_records: List[Dict[str, Any]] = []
+        self._slug_to_idx: Dict[str, int] = {}
+        # progress: one column per filter key, records alongside.
+        self._progress_users: List[str] = []
+        self._progress_lessons: List[Optional[str]] = []
+        self._progress_records: List[Dict[str, Any]] = []
+
+    # -- lessons ---------------------------------------------------------
+
+    def add_lesson(self, lesson: Dict[str, Any]) -> Dict[str, Any]:
+        slug = lesson["slug"]
+        idx = self._slug_to_idx.get(slug)
+        if idx is not None:
+            self._lesson_records[idx] = lesson
+            return lesson
+        self._slug_to_idx[slug] = len(self._lesson_records)
+        self._lesson_slugs.append(slug)
+        self._lesson_records.append(lesson)
+        return lesson
+
+    def list_lessons(self) -> List[Dict[str, Any]]:
+        return list(self._lesson_records)
+
+    def get_lesson(self, slug: str) -> Optional[Dict[str, Any]]:
+        idx = self._slug_to_idx.get(slug)
+        if idx is None:
+            return None
+        return self._lesson_records[idx]
+
+    # -- progress --------------------------------------------------------
+
+    def record_progress(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        entry.setdefault("recordedAt", datetime.now(timezone.utc))
+        self._progress_users.append(entry.get("userId", ""))
+        self._progress_lessons.append(entry.get("lessonSlug"))
+        self._progress_records.append(entry)
+        return entry
+
+    def progress_for_user(self, user_id: str) -> List[Dict[str, Any]]:
+        records = self._progress_records
+        return [
+            records[i]
+            for i, uid in enumerate(self._progress_users)
+            if uid == user_id
+        ]
+
+    def progress_for_lesson(self, lesson_slug: str) -> List[Dict[str, Any]]:
+        records = self._progress_records
+        return [
+            records[i]
+            for i, slug in enumerate(self._progress_lessons)
+            if slug == lesson_slug
+        ]
+
+
+# Single process-wide instance. The prototype only ever has one repository,
+# so dependents bind to it directly instead of going through app.state.
+DEFAULT_REPO = InMemoryRepository()
@@ -0,0 +1,300 @@
+"""Mongo-backed content catalog endpoints (skills, lessons, tree)."""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+from ...db.mongo_catalog import MongoCatalogRepository
+from ..caching import cached_response, invalidate, invalidate_prefix, store_response
+from ..dependencies import require_admin
+from ..relational_schemas import SubjectRead
+from ..schemas import (
+    LessonModel,
+    LessonUpdate,
+    SkillListResponse,
+    SkillModel,
+    SkillUpdate,
+)
+from ..serialization import msgpack_response, wants_msgpack
+
+router = APIRouter(prefix="/content", tags=["catalog"])
+
+try:
+    import msgspec
+
+    from ..fast_schemas import lesson_decoder, lesson_to_doc
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+def _decode_lesson_body(body: bytes) -> Dict[str, Any]:
+    """Decode and validate a lesson payload from raw JSON bytes.
+
+    msgspec does decode + struct validation in one C pass; the Pydantic
+    model is the fallback (and produces the 422 when both reject).
+    """
+    if msgspec is not None:
+        try:
+            return lesson_to_doc(lesson_decoder.decode(body))
+        except msgspec.ValidationError as exc:
+            raise HTTPException(status_code=422, detail=str(exc))
+        except msgspec.DecodeError:
+            pass
+    try:
+        return LessonModel.model_validate_json(body).model_dump()
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+
+def get_repo(request: Request) -> MongoCatalogRepository:
+    # Built once in the lifespan startup (including index creation);
+    # per-request this is just an attribute read.
+    repo = request.app.state.catalog_repo
+    if repo is None:
+        raise HTTPException(status_code=503, detail="Catalog store unavailable")
+    return repo
+
+
+async def _stream_skill_page(repo, category, page, page_size, total):
+    # Frame the envelope by hand and emit one orjson fragment per
+    # document straight off the cursor: O(1) extra memory instead of the
+    # full list plus its JSON bytes, and the client sees first bytes
+    # before the last batch arrives.
+    yield b'{"items":['
+    first = True
+    async for doc in repo.iter_skills(
+        category=category, skip=(page - 1) * page_size, limit=page_size
+    ):
+        if first:
+            first = False
+        else:
+            yield b","
+        yield orjson.dumps(doc)
+    yield b'],"total":%d,"page":%d,"page_size":%d}' % (total, page, page_size)
+
+
+# No response_model on the hot list path: the documents come from our own
+# repository, so re-validating them per request is wasted CPU. The schema
+# is kept in the OpenAPI docs via `responses`.
+@router.get(
+    "/skills",
+    responses={200: {"model": SkillListResponse}},
+)
+async def list_skills(
+    request: Request,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=500),
+    category: Optional[str] = None,
+    repo: MongoCatalogRepository = Depends(get_repo),
+):
+    if wants_msgpack(request):
+        # msgpack has no incremental framing here; keep the materialized
+        # path for clients that asked for it.
+        items = await repo.list_skills(category=category)
+        start = (page - 1) * page_size
+        return msgpack_response(
+            {
+                "items": items[start : start + page_size],
+                "total": len(items),
+                "page": page,
+                "page_size": page_size,
+            }
+        )
+    total = await repo.count_skills(category=category)
+    return StreamingResponse(
+        _stream_skill_page(repo, category, page, page_size, total),
+        media_type="application/json",
+    )
+
+
+# Conditional-GET caching on the rarely-changing single-document reads:
+# a cache hit skips Mongo and serialization, and a matching If-None-Match
+# collapses the response to a 304 header compare. Writes below invalidate
+# the affected keys.
+@router.get(
+    "/skills/{slug}",
+    responses={200: {"model": SkillModel}},
+)
+async def get_skill(
+    request: Request, slug: str, repo: MongoCatalogRepository = Depends(get_repo)
+):
+    cached = cached_response(request, f"skill:{slug}")
+    if cached is not None:
+        return cached
+    skill = await repo.get_skill(slug)
+    if skill is None:
+        raise HTTPException(status_code=404, detail="Skill not found")
+    return store_response(request, f"skill:{slug}", skill)
+
+
+@router.post("/skills", response_model=SkillModel, status_code=201)
+async def create_skill(
+    payload: SkillModel,
+    repo: MongoCatalogRepository = Depends(get_repo),
+    claims: dict = Depends(require_admin),
+):
+    # One clock read per request; tz-aware so orjson emits the Z suffix
+    # without a normalization pass.
+    now = datetime.now(timezone.utc)
+    doc = payload.model_dump()
+    doc["createdAt"] = now
+    doc["updatedAt"] = now
+    skill = await repo.upsert_skill(doc)
+    # Invalidate after the write commits, as the update path does — a
+    # concurrent GET racing an early invalidation could re-cache the
+    # pre-write document for the full TTL.
+    invalidate(f"skill:{doc['slug']}")
+    return skill
+
+
+@router.get(
+    "/skills/{slug}/lessons",
+    responses={200: {"model": List[LessonModel]}},
+)
+async def list_lessons_for_skill(
+    request: Request, slug: str, repo: MongoCatalogRepository = Depends(get_repo)
+):
+    if wants_msgpack(request):
+        return msgpack_response(await repo.list_lessons_for_skill(slug))
+    cached = cached_response(request, f"lessons:{slug}")
+    if cached is not None:
+        return cached
+    lessons = await repo.list_lessons_for_skill(slug)
+    return store_response(request, f"lessons:{slug}", lessons)
+
+
+@router.get(
+    "/lessons/{slug}",
+    responses={200: {"model": LessonModel}},
+)
+async def get_lesson(
+    request: Request, slug: str, repo: MongoCatalogRepository = Depends(get_repo)
+):
+    cached = cached_response(request, f"lesson:{slug}")
+    if cached is not None:
+        return cached
+    lesson = await repo.get_lesson(slug)
+    if lesson is None:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    return store_response(request, f"lesson:{slug}", lesson)
+
+
+@router.post(
+    "/lessons",
+    response_model=LessonModel,
+    status_code=201,
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {"schema": LessonModel.model_json_schema()}
+            },
+            "required": True,
+        }
+    },
+)
+async def create_lesson(
+    request: Request,
+    repo: MongoCatalogRepository = Depends(get_repo),
+    claims: dict = Depends(require_admin),
+):
+    body = await request.body()
+    doc = _decode_lesson_body(body)
+    now = datetime.now(timezone.utc)
+    doc["createdAt"] = now
+    doc["updatedAt"] = now
+    lesson = await repo.upsert_lesson(doc)
+    invalidate(f"lesson:{doc['slug']}", f"lessons:{doc['skillSlug']}")
+    return lesson
+
+
+@router.put("/skills/{slug}", response_model=SkillModel)
+async def update_skill(
+    slug: str,
+    updates: SkillUpdate,
+    repo: MongoCatalogRepository = Depends(get_repo),
+    claims: dict = Depends(require_admin),
+):
+    changes = updates.model_dump(exclude_unset=True)
+    changes["updatedAt"] = datetime.now(timezone.utc)
+    skill = await repo.update_skill(slug, changes)
+    if skill is None:
+        raise HTTPException(status_code=404, detail="Skill not found")
+    invalidate(f"skill:{slug}")
+    return skill
+
+
+# Typed update payloads: pydantic-core validates the quiz array (and
+# everything else) in Rust, replacing the ad-hoc isinstance/loop checks
+# this handler used to run, and gives orjson a known shape on the way
+# back out.
+@router.put("/lessons/{slug}", response_model=LessonModel)
+async def update_lesson(
+    slug: str,
+    updates: LessonUpdate,
+    repo: MongoCatalogRepository = Depends(get_repo),
+    claims: dict = Depends(require_admin),
+):
+    changes = updates.model_dump(exclude_unset=True)
+    changes["updatedAt"] = datetime.now(timezone.utc)
+    lesson = await repo.update_lesson(slug, changes)
+    if lesson is None:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    invalidate(f"lesson:{slug}", f"lessons:{lesson.get('skillSlug')}")
+    return lesson
+
+
+@router.delete("/lessons/{slug}", status_code=204)
+async def delete_lesson(
+    slug: str,
+    repo: MongoCatalogRepository = Depends(get_repo),
+    claims: dict = Depends(require_admin),
+):
+    if not await repo.delete_lesson(slug):
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    # The parent skill's slug is gone with the document, so drop every
+    # cached lessons list rather than reading the doc back first.
+    invalidate(f"lesson:{slug}")
+    invalidate_prefix("lessons:")
+
+
+# The tree is O(modules x lessons x activities) nodes; running each node
+# through the nested Pydantic models costs one BaseModel construction per
+# node. Build plain dicts and hand them to ORJSONResponse directly; the
+# nested schema remains documented via `responses`.
+@router.get("/tree", responses={200: {"model": List[SubjectRead]}})
+async def content_tree(repo: MongoCatalogRepository = Depends(get_repo)):
+    """Whole catalog as a Subject -> Module -> Lesson tree.
+
+    Categories map to subjects and skills map to modules.
+    """
+    skills = await repo.list_skills()
+    subjects: Dict[str, Dict[str, Any]] = {}
+    for i, skill in enumerate(skills):
+        category = skill.get("category") or "General"
+        cat_slug = skill.get("categorySlug") or "general"
+        subject = subjects.get(cat_slug)
+        if subject is None:
+            subject = {"slug": cat_slug, "title": category, "modules": []}
+            subjects[cat_slug] = subject
+        lessons = [
+            {
+                "slug": lesson["slug"],
+                "title": lesson["title"],
+                "content": lesson.get("content"),
+                "order_index": lesson.get("order", 0),
+            }
+            for lesson in await repo.list_lessons_for_skill(skill["slug"])
+        ]
+        subject["modules"].append(
+            {
+                "slug": skill["slug"],
+                "title": skill["name"],
+                "description": skill.get("description"),
+                "order_index": i,
+                "lessons": lessons,
+            }
+        )
+    return ORJSONResponse(content=list(subjects.values()))
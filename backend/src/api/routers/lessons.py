@@ -0,0 +1,35 @@
+"""Prototype lesson endpoints backed by the in-memory repository."""
+
+from typing import Any, Dict, List
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
+
+from ..dependencies import get_repository_dep
+from ..repositories import InMemoryRepository
+from ..relational_schemas import LessonRead
+
+router = APIRouter(prefix="/lessons", tags=["lessons"])
+
+
+@router.get("", response_model=List[LessonRead], response_class=ORJSONResponse)
+async def list_lessons(repo: InMemoryRepository = Depends(get_repository_dep)):
+    return repo.list_lessons()
+
+
+@router.get("/{slug}", response_model=LessonRead, response_class=ORJSONResponse)
+async def get_lesson(slug: str, repo: InMemoryRepository = Depends(get_repository_dep)):
+    lesson = repo.get_lesson(slug)
+    if lesson is None:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    return lesson
+
+
+@router.post("", response_model=LessonRead, status_code=201)
+async def add_lesson(
+    payload: Dict[str, Any],
+    repo: InMemoryRepository = Depends(get_repository_dep),
+):
+    if "slug" not in payload or "title" not in payload:
+        raise HTTPException(status_code=422, detail="slug and title are required")
+    return repo.add_lesson(payload)
@@ -0,0 +1,93 @@
+"""Prototype learner-progress endpoints backed by the in-memory repository."""
+
+from typing import List
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+from ..dependencies import get_repository_dep
+from ..repositories import InMemoryRepository
+from ..relational_schemas import ProgressRead
+from ..serialization import msgpack_response, wants_msgpack
+
+router = APIRouter(prefix="/progress", tags=["progress"])
+
+
+class ProgressEvent(BaseModel):
+    user_id: str
+    lesson_slug: str
+    status: str = "in_progress"
+    score: float | None = None
+
+
+@router.get(
+    "/{user_id}",
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[ProgressRead]}},
+)
+async def get_user_progress(
+    request: Request,
+    user_id: str,
+    repo: InMemoryRepository = Depends(get_repository_dep),
+):
+    # Built as plain dicts (no response validation, see the trusted-read
+    # note on the lesson endpoint) so the payload can go straight to
+    # either encoder.
+    payload = [
+        {
+            "user_id": e["userId"],
+            "lesson_slug": e.get("lessonSlug"),
+            "status": e.get("status", "in_progress"),
+            "score": e.get("score"),
+            "recorded_at": e.get("recordedAt"),
+        }
+        for e in repo.progress_for_user(user_id)
+    ]
+    if wants_msgpack(request):
+        return msgpack_response(payload)
+    return ORJSONResponse(content=payload)
+
+
+@router.post("/complete", response_model=ProgressRead, status_code=201)
+async def mark_lesson_complete(
+    event: ProgressEvent,
+    repo: InMemoryRepository = Depends(get_repository_dep),
+):
+    entry = repo.record_progress(
+        {
+            "userId": event.user_id,
+            "lessonSlug": event.lesson_slug,
+            "status": "completed",
+            "score": event.score,
+        }
+    )
+    return ProgressRead(
+        user_id=entry["userId"],
+        lesson_slug=entry.get("lessonSlug"),
+        status=entry["status"],
+        score=entry.get("score"),
+        recorded_at=entry.get("recordedAt"),
+    )
+
+
+@router.get("/lesson/{lesson_slug}", responses={200: {"model": List[ProgressRead]}})
+async def get_progress_for_lesson(
+    lesson_slug: str,
+    repo: InMemoryRepository = Depends(get_repository_dep),
+):
+    # One serialization pass: build the response dicts directly and let
+    # orjson encode them (datetimes included) instead of constructing
+    # ProgressRead models, dumping them and re-encoding.
+    return ORJSONResponse(
+        content=[
+            {
+                "user_id": e["userId"],
+                "lesson_slug": e.get("lessonSlug"),
+                "status": e.get("status", "in_progress"),
+                "score": e.get("score"),
+                "recorded_at": e.get("recordedAt"),
+            }
+            for e in repo.progress_for_lesson(lesson_slug)
+        ]
+    )
@@ -0,0 +1,179 @@
+"""Relational learner-progress endpoints (/curriculum/progress).
+
+Progress is one state row per (user, lesson, activity) target —
+``uq_progress_user_target`` in db.models — so writes are single-statement
+upserts: INSERT ... ON CONFLICT DO UPDATE addresses the row in one
+round-trip with no SELECT-then-branch window for concurrent duplicates.
+"""
+
+from typing import Any, Dict
+
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import exists, func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...db.models import Activity, Lesson, Progress
+from ..dependencies import get_async_db
+from ..relational_schemas import ProgressEntryRead, ProgressUpsert
+
+router = APIRouter(prefix="/curriculum/progress", tags=["progress"])
+
+# Short-TTL response cache for list_progress, keyed per user and page so
+# one learner's dashboard polling stops re-running the page query every
+# few seconds. Writers invalidate their user's entries, so the TTL only
+# bounds staleness across processes. Keys always start with user_id —
+# a page is never served to a different user's key.
+_LIST_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=30)
+
+
+def invalidate_progress_cache(user_id: str) -> None:
+    """Drop cached list pages for one user after a progress write."""
+    stale = [key for key in _LIST_CACHE if key[0] == user_id]
+    for key in stale:
+        _LIST_CACHE.pop(key, None)
+
+# Conflict target matching uq_progress_user_target: the COALESCE
+# expressions must be spelled exactly as in the index definition.
+_CONFLICT_TARGET = [
+    text("user_id"),
+    text("coalesce(lesson_id, 0)"),
+    text("coalesce(activity_id, 0)"),
+]
+
+
+def build_progress_upsert(dialect_name: str, values: Dict[str, Any], keep_existing: bool = False):
+    """One-statement progress upsert for the given dialect.
+
+    ``keep_existing`` inserts only when the target row is absent (used
+    for unlock markers that must not clobber richer existing state).
+    Otherwise the conflict row is overwritten, except when status and
+    score already match — the IS DISTINCT FROM guard skips the no-op
+    UPDATE so unchanged submissions cause no MVCC row churn.
+    """
+    insert_fn = sqlite_insert if dialect_name == "sqlite" else pg_insert
+    stmt = insert_fn(Progress).values(**values)
+    if keep_existing:
+        return stmt.on_conflict_do_nothing(index_elements=_CONFLICT_TARGET)
+    return stmt.on_conflict_do_update(
+        index_elements=_CONFLICT_TARGET,
+        set_={
+            "status": stmt.excluded.status,
+            "score": stmt.excluded.score,
+            "updated_at": func.now(),
+        },
+        where=(
+            Progress.status.is_distinct_from(stmt.excluded.status)
+            | Progress.score.is_distinct_from(stmt.excluded.score)
+        ),
+    )
+
+
+# Reference field -> referenced model, driving the EXISTS probes and the
+# 400 details from one table instead of a branch per field.
+_REF_MODELS = {"lesson_id": Lesson, "activity_id": Activity}
+
+
+async def _validate_references(db: AsyncSession, payload: ProgressUpsert) -> None:
+    """400 on a dangling lesson or activity reference.
+
+    The FK constraints would reject the write anyway, but with two
+    nullable references in one row the driver error doesn't say which
+    one failed (SQLite reports no column at all), so resolve them up
+    front for a usable message. Both refs are probed by one SELECT of
+    EXISTS expressions rather than a primary-key lookup each — the
+    upsert path is round-trip-bound, not compute-bound.
+    """
+    checks = [
+        (field, exists(select(model.id).where(model.id == ref)))
+        for field, model in _REF_MODELS.items()
+        if (ref := getattr(payload, field)) is not None
+    ]
+    if not checks:
+        return
+    row = (await db.execute(select(*(clause for _, clause in checks)))).first()
+    for (field, _), found in zip(checks, row):
+        if not found:
+            raise HTTPException(status_code=400, detail=f"Invalid {field}")
+
+
+def to_progress_read(row: Progress) -> ProgressEntryRead:
+    # model_construct skips field validation — the values come straight
+    # from our own Progress row, already typed by the database.
+    return ProgressEntryRead.model_construct(
+        id=row.id,
+        user_id=row.user_id,
+        lesson_id=row.lesson_id,
+        activity_id=row.activity_id,
+        status=row.status,
+        score=row.score,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
+
+
+def _target_clause(payload: ProgressUpsert):
+    # ``== None`` already renders as IS NULL; no per-column ternary
+    # picking .is_(None) by hand.
+    return (
+        Progress.user_id == payload.user_id,
+        Progress.lesson_id == payload.lesson_id,
+        Progress.activity_id == payload.activity_id,
+    )
+
+
+@router.post("", response_model=ProgressEntryRead)
+async def upsert_progress(
+    payload: ProgressUpsert,
+    db: AsyncSession = Depends(get_async_db),
+):
+    await _validate_references(db, payload)
+    stmt = build_progress_upsert(
+        db.get_bind().dialect.name, payload.model_dump()
+    ).returning(Progress)
+    row = (await db.execute(stmt)).scalars().first()
+    if row is None:
+        # The no-op guard skipped the UPDATE: the stored row already has
+        # these values. Read it back only on this path.
+        await db.rollback()
+        row = (
+            await db.execute(select(Progress).where(*_target_clause(payload)))
+        ).scalars().first()
+        return to_progress_read(row)
+    await db.commit()
+    invalidate_progress_cache(payload.user_id)
+    return to_progress_read(row)
+
+
+@router.get("/{user_id}")
+async def list_progress(
+    user_id: str,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+):
+    cache_key = (user_id, page, page_size)
+    cached = _LIST_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    # COUNT(*) OVER () rides along as an extra column, so the page and
+    # the total come from one scan instead of a separate count query
+    # repeating the same predicate.
+    result = await db.execute(
+        select(Progress, func.count().over().label("total"))
+        .where(Progress.user_id == user_id)
+        .order_by(Progress.updated_at.desc(), Progress.id.desc())
+        .limit(page_size)
+        .offset((page - 1) * page_size)
+    )
+    rows = result.all()
+    payload = {
+        "items": [to_progress_read(row.Progress) for row in rows],
+        "total": rows[0].total if rows else 0,
+        "page": page,
+        "page_size": page_size,
+    }
+    _LIST_CACHE[cache_key] = payload
+    return payload
@@ -0,0 +1,520 @@
+"""AI quiz generation and submission endpoints (relational models)."""
+
+import asyncio
+import hashlib
+import uuid
+from typing import Any, Dict, List, Optional
+
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from sqlalchemy import insert, lambda_stmt, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased, load_only
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...db.models import Activity, ActivityType, Lesson
+
+# Hoisted once: lambda statements instrument variable lookups inside
+# their bodies, so the enum must be resolved to a plain int outside.
+_QUIZ_TYPE = int(ActivityType.QUIZ)
+from ...db.sqlalchemy import get_async_session_factory
+from ...services.quiz_generator import OpenAIQuizGenerator
+from ..dependencies import get_async_db, require_admin
+from ..errors import ApplicationError
+from .progress_relational import build_progress_upsert, invalidate_progress_cache
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+router = APIRouter(prefix="/ai/quiz", tags=["quiz-ai"])
+
+# Cosine similarity above which a sibling lesson's quiz is considered a
+# paraphrase of the requested content and reused instead of regenerated.
+_SIMILARITY_THRESHOLD = 0.92
+
+_generator = OpenAIQuizGenerator()
+
+# Per-cache-key locks so concurrent identical generation requests
+# coalesce into one OpenAI call instead of racing N of them.
+_GENERATION_LOCKS: Dict[str, asyncio.Lock] = {}
+
+# Background generation records, keyed by generation_id. Each holds the
+# running task (kept referenced so it isn't garbage-collected) and the
+# result once the worker finishes; entries age out after an hour.
+_GENERATIONS: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+
+
+class GenerateQuizRequest(BaseModel):
+    lesson_id: int
+    difficulty: str = "medium"
+    num_questions: int = 3
+    pass_score: int = 70
+
+
+class GenerateQuizBatchRequest(BaseModel):
+    lesson_ids: List[int]
+    difficulty: str = "medium"
+    num_questions: int = 3
+    pass_score: int = 70
+
+
+class SubmitQuizRequest(BaseModel):
+    activity_id: int
+    user_id: str
+    answers: List[int]
+
+
+def _answer_key(questions: List[Dict[str, Any]]) -> bytes:
+    """Pack the correct option indices as one int8 per question.
+
+    An index outside 0..127 (malformed generator output) packs as -128,
+    a sentinel distinct from _grade's -1 missing-answer marker, so it
+    can never accidentally match a submission.
+    """
+    out = bytearray()
+    for q in questions:
+        idx = int(q.get("answerIndex", 0))
+        out.append(idx if 0 <= idx <= 127 else 0x80)
+    return bytes(out)
+
+
+def _grade(activity: Activity, answers: List[int]) -> int:
+    """Count correct answers.
+
+    With a precomputed answer key this is one vectorized int8 compare;
+    the per-question Python loop remains for rows generated before the
+    key existed (or when numpy is absent).
+    """
+    questions = activity.quiz_questions or []
+    if np is not None and activity.answer_key is not None:
+        key = np.frombuffer(activity.answer_key, dtype=np.int8)
+        given = np.full(len(key), -1, dtype=np.int8)
+        n = min(len(answers), len(key))
+        # Answers are client-supplied ints; anything outside the packed
+        # 0..127 range grades as wrong via the -1 sentinel instead of
+        # overflowing the int8 conversion.
+        given[:n] = [a if 0 <= a <= 127 else -1 for a in answers[:n]]
+        return int((given == key).sum())
+    correct = 0
+    for i, question in enumerate(questions):
+        try:
+            if answers[i] == int(question["answerIndex"]):
+                correct += 1
+        except (IndexError, KeyError, TypeError, ValueError):
+            continue
+    return correct
+
+
+def _quiz_cache_key(lesson: Lesson, difficulty: str, pass_score: int) -> str:
+    """Fingerprint of everything the generated quiz depends on.
+
+    updated_at is part of the key, so editing lesson content naturally
+    invalidates prior generations without any explicit bookkeeping.
+    """
+    raw = f"{lesson.id}|{difficulty}|{pass_score}|{lesson.updated_at}|{lesson.content}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+async def _cached_quiz(
+    db: AsyncSession, lesson: Lesson, difficulty: str, pass_score: int
+) -> Optional[Activity]:
+    key = _quiz_cache_key(lesson, difficulty, pass_score)
+    result = await db.execute(
+        select(Activity).where(
+            Activity.lesson_id == lesson.id,
+            Activity.type == _QUIZ_TYPE,
+            Activity.cache_key == key,
+        )
+    )
+    return result.scalars().first()
+
+
+async def _similar_quiz(
+    db: AsyncSession, lesson: Lesson, embedding: List[float]
+) -> Optional[Activity]:
+    """Find a sibling lesson's quiz whose source content matched ours.
+
+    Near-duplicate lessons (whitespace, reordering, light paraphrase)
+    embed almost identically; one batched dot product over the siblings'
+    stored vectors replaces an LLM round-trip when any exceeds the
+    threshold.
+    """
+    if lesson.module_id is None:
+        return None
+    result = await db.execute(
+        select(Activity)
+        .join(Lesson, Lesson.id == Activity.lesson_id)
+        .where(
+            Lesson.module_id == lesson.module_id,
+            Activity.type == _QUIZ_TYPE,
+            Activity.quiz_embedding.isnot(None),
+        )
+    )
+    candidates = result.scalars().all()
+    if not candidates:
+        return None
+    if np is not None:
+        q = np.asarray(embedding, dtype=np.float32)
+        embs = np.asarray([a.quiz_embedding for a in candidates], dtype=np.float32)
+        sims = embs @ q / (np.linalg.norm(embs, axis=1) * np.linalg.norm(q))
+        best = int(sims.argmax())
+        if float(sims[best]) > _SIMILARITY_THRESHOLD:
+            return candidates[best]
+        return None
+    # Pure-Python fallback; candidate counts are module-sized (small).
+    q_norm = sum(x * x for x in embedding) ** 0.5
+    best_sim, best_activity = 0.0, None
+    for activity in candidates:
+        vec = activity.quiz_embedding
+        dot = sum(a * b for a, b in zip(vec, embedding))
+        norm = sum(x * x for x in vec) ** 0.5
+        sim = dot / (norm * q_norm) if norm and q_norm else 0.0
+        if sim > best_sim:
+            best_sim, best_activity = sim, activity
+    return best_activity if best_sim > _SIMILARITY_THRESHOLD else None
+
+
+async def _generate_for_lesson(
+    db: AsyncSession, lesson: Lesson, payload: GenerateQuizRequest
+):
+    """Generate (or reuse) a quiz for a lesson; returns (activity, cached_hit)."""
+    key = _quiz_cache_key(lesson, payload.difficulty, payload.pass_score)
+    lock = _GENERATION_LOCKS.setdefault(key, asyncio.Lock())
+    # The finally-pop keeps the lock table bounded: keys embed
+    # updated_at and content, so without it every cache hit and failed
+    # generation would strand an entry forever. Waiters already queued
+    # on the popped lock still serialize among themselves, and the
+    # re-check under the lock absorbs any duplicate that slips through.
+    try:
+        async with lock:
+            # Another request may have generated while we waited on the lock.
+            cached = await _cached_quiz(db, lesson, payload.difficulty, payload.pass_score)
+            if cached is not None:
+                return cached, True
+            embedding = None
+            if lesson.content:
+                embedding = await _generator.embed(lesson.content)
+                similar = await _similar_quiz(db, lesson, embedding)
+                if similar is not None:
+                    return similar, True
+            questions = await _generator.generate_quiz(
+                lesson.title,
+                lesson.content or "",
+                difficulty=payload.difficulty,
+                num_questions=payload.num_questions,
+            )
+            # INSERT ... RETURNING: one statement instead of the
+            # add/commit/refresh INSERT + SELECT pair.
+            try:
+                result = await db.execute(
+                    insert(Activity)
+                    .values(
+                        lesson_id=lesson.id,
+                        title=f"Quiz: {lesson.title}",
+                        type=_QUIZ_TYPE,
+                        quiz_questions=questions,
+                        quiz_questions_json=orjson.dumps(questions),
+                        quiz_pass_score=payload.pass_score,
+                        cache_key=key,
+                        quiz_embedding=embedding,
+                        answer_key=_answer_key(questions),
+                    )
+                    .returning(Activity)
+                )
+                activity = result.scalar_one()
+                await db.commit()
+            except IntegrityError:
+                # A duplicate that slipped past the popped lock landed
+                # its row first; the unique cache_key caught it, so
+                # serve that row instead of failing the generation.
+                # Query by the precomputed key — the rollback expired
+                # ``lesson``, so re-deriving it would lazy-load.
+                await db.rollback()
+                result = await db.execute(
+                    select(Activity).where(
+                        Activity.type == _QUIZ_TYPE,
+                        Activity.cache_key == key,
+                    )
+                )
+                stored = result.scalars().first()
+                if stored is None:
+                    raise
+                return stored, True
+        return activity, False
+    finally:
+        _GENERATION_LOCKS.pop(key, None)
+
+
+async def _run_generation(generation_id: str, payload: GenerateQuizRequest) -> None:
+    """Background worker: generates on its own session, records the outcome."""
+    factory = get_async_session_factory()
+    try:
+        async with factory() as db:
+            result = await db.execute(
+                select(Lesson).where(Lesson.id == payload.lesson_id)
+            )
+            lesson = result.scalars().first()
+            if lesson is None:
+                _GENERATIONS[generation_id] = {
+                    "status": "failed",
+                    "detail": "Lesson not found",
+                }
+                return
+            activity, cached_hit = await _generate_for_lesson(db, lesson, payload)
+            _GENERATIONS[generation_id] = {
+                "status": "complete",
+                **_activity_payload(activity, cached_hit),
+            }
+    except ApplicationError as exc:
+        _GENERATIONS[generation_id] = {"status": "failed", "detail": exc.message}
+    except Exception as exc:  # noqa: BLE001 - nothing above us to re-raise to
+        _GENERATIONS[generation_id] = {"status": "failed", "detail": str(exc)[:200]}
+
+
+@router.post("/generate", status_code=202)
+async def generate_quiz(
+    payload: GenerateQuizRequest,
+    db: AsyncSession = Depends(get_async_db),
+    claims: dict = Depends(require_admin),
+):
+    """Enqueue quiz generation and return a poll handle.
+
+    The OpenAI round-trip takes seconds; holding the request open for it
+    would pin a connection per generation. Cache hits still answer 200
+    inline (no model call involved); everything else runs in a
+    background task and is fetched via the status endpoint.
+    """
+    result = await db.execute(select(Lesson).where(Lesson.id == payload.lesson_id))
+    lesson = result.scalars().first()
+    if lesson is None:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    cached = await _cached_quiz(db, lesson, payload.difficulty, payload.pass_score)
+    if cached is not None:
+        return ORJSONResponse(content=_activity_payload(cached, cached_hit=True))
+
+    generation_id = uuid.uuid4().hex
+    task = asyncio.create_task(_run_generation(generation_id, payload))
+    _GENERATIONS[generation_id] = {"status": "pending", "_task": task}
+    return {
+        "generation_id": generation_id,
+        "status": "pending",
+        "poll_url": f"/ai/quiz/status/{generation_id}",
+    }
+
+
+@router.post("/generate_batch", status_code=201)
+async def generate_quiz_batch(
+    payload: GenerateQuizBatchRequest,
+    db: AsyncSession = Depends(get_async_db),
+    claims: dict = Depends(require_admin),
+):
+    """Generate quizzes for several lessons with one model call.
+
+    Adjacent lessons are typically generated back-to-back; packing them
+    into one prompt turns N OpenAI round-trips into one and lets the
+    provider reuse the cached system preamble across batches.
+    """
+    if not payload.lesson_ids:
+        raise HTTPException(status_code=400, detail="lesson_ids must not be empty")
+    result = await db.execute(
+        select(Lesson).where(Lesson.id.in_(payload.lesson_ids))
+    )
+    by_id = {lesson.id: lesson for lesson in result.scalars()}
+    missing = [i for i in payload.lesson_ids if i not in by_id]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Lessons not found: {missing}")
+    lessons = [by_id[i] for i in payload.lesson_ids]
+
+    # Drop lessons whose quiz for these inputs already exists; one IN
+    # query covers the whole batch.
+    keys = {
+        lesson.id: _quiz_cache_key(lesson, payload.difficulty, payload.pass_score)
+        for lesson in lessons
+    }
+    existing = await db.execute(
+        select(Activity.cache_key).where(Activity.cache_key.in_(keys.values()))
+    )
+    cached_keys = set(existing.scalars())
+    to_generate = [lesson for lesson in lessons if keys[lesson.id] not in cached_keys]
+    if not to_generate:
+        return {"generated": 0, "cached": len(lessons)}
+
+    quizzes = await _generator.generate_quiz_batch(
+        [{"title": lesson.title, "content": lesson.content or ""} for lesson in to_generate],
+        difficulty=payload.difficulty,
+        num_questions=payload.num_questions,
+        prompt_cache_key=(
+            f"lessons-{to_generate[0].module_id}"
+            if to_generate[0].module_id is not None
+            else None
+        ),
+    )
+    rows = [
+        {
+            "lesson_id": lesson.id,
+            "title": f"Quiz: {lesson.title}",
+            "type": _QUIZ_TYPE,
+            "quiz_questions": questions,
+            "quiz_questions_json": orjson.dumps(questions),
+            "quiz_pass_score": payload.pass_score,
+            "cache_key": keys[lesson.id],
+            "answer_key": _answer_key(questions),
+        }
+        for lesson, questions in zip(to_generate, quizzes)
+    ]
+    # One executemany INSERT for the whole batch.
+    await db.execute(insert(Activity), rows)
+    await db.commit()
+    return {"generated": len(rows), "cached": len(lessons) - len(rows)}
+
+
+@router.get("/status/{generation_id}")
+async def get_generation_status(generation_id: str):
+    record = _GENERATIONS.get(generation_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Unknown generation id")
+    return {k: v for k, v in record.items() if not k.startswith("_")}
+
+
+def _activity_payload(activity: Activity, cached_hit: bool) -> Dict[str, Any]:
+    return {
+        "activity_id": activity.id,
+        "lesson_id": activity.lesson_id,
+        "questions": activity.quiz_questions,
+        "pass_score": activity.quiz_pass_score,
+        "cached": cached_hit,
+    }
+
+
+def _lesson_quiz_stmt(lesson_id: int):
+    # lambda_stmt: SQLAlchemy caches the compiled SQL for this shape and
+    # only swaps the lesson_id bind on subsequent calls, skipping the
+    # per-request statement construction and compilation. load_only keeps
+    # the cold columns (lesson content hash inputs, embedding, answer
+    # key) out of the fetch so the ordered (lesson_id, type, order_index,
+    # id) index does most of the work.
+    return lambda_stmt(
+        lambda: select(Activity)
+        .options(
+            load_only(
+                Activity.id,
+                Activity.lesson_id,
+                Activity.title,
+                Activity.type,
+                Activity.quiz_questions,
+                Activity.quiz_questions_json,
+                Activity.quiz_pass_score,
+            )
+        )
+        .where(Activity.lesson_id == lesson_id, Activity.type == _QUIZ_TYPE)
+        .order_by(Activity.order_index, Activity.id)
+        .limit(1)
+    )
+
+
+@router.get("/lesson/{lesson_id}")
+async def get_lesson_quiz(lesson_id: int, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(_lesson_quiz_stmt(lesson_id))
+    activity = result.scalars().first()
+    if activity is None:
+        raise HTTPException(status_code=404, detail="No quiz for this lesson")
+    if activity.quiz_questions_json is not None:
+        # Hot path: splice the bytes stored at generation time into a
+        # hand-framed envelope — no JSON decode of the column and no
+        # re-encode of the questions on the way out.
+        body = b'{"activity_id":%d,"lesson_id":%d,"title":%s,"questions":%s,"pass_score":%s}' % (
+            activity.id,
+            activity.lesson_id,
+            orjson.dumps(activity.title),
+            activity.quiz_questions_json,
+            orjson.dumps(activity.quiz_pass_score),
+        )
+        return Response(content=body, media_type="application/json")
+    # Rows generated before the pre-serialized column existed.
+    return {
+        "activity_id": activity.id,
+        "lesson_id": activity.lesson_id,
+        "title": activity.title,
+        "questions": activity.quiz_questions,
+        "pass_score": activity.quiz_pass_score,
+    }
+
+
+@router.post("/submit")
+async def submit_quiz(
+    payload: SubmitQuizRequest, db: AsyncSession = Depends(get_async_db)
+):
+    # One round-trip for activity + lesson + next-lesson id: the lesson
+    # rides along on a join and the successor comes from a correlated
+    # scalar subquery, instead of three sequential SELECTs.
+    next_lesson = aliased(Lesson)
+    next_lesson_id = (
+        select(next_lesson.id)
+        .where(
+            next_lesson.module_id == Lesson.module_id,
+            next_lesson.order_index > Lesson.order_index,
+        )
+        .order_by(next_lesson.order_index)
+        .limit(1)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        select(Activity, Lesson, next_lesson_id)
+        .join(Lesson, Lesson.id == Activity.lesson_id)
+        .where(Activity.id == payload.activity_id, Activity.type == _QUIZ_TYPE)
+    )
+    row = result.first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    activity, lesson, next_id = row
+
+    questions = activity.quiz_questions or []
+    correct = _grade(activity, payload.answers)
+    score = (correct / len(questions) * 100) if questions else 0.0
+    passed = score >= (activity.quiz_pass_score or 0)
+
+    # Progress is one state row per (user, lesson, activity): the quiz
+    # row upserts in place (a retake overwrites the previous attempt)
+    # and the unlock marker inserts only if absent, so it never clobbers
+    # richer state already recorded for the next lesson.
+    dialect = db.get_bind().dialect.name
+    await db.execute(
+        build_progress_upsert(
+            dialect,
+            {
+                "user_id": payload.user_id,
+                "lesson_id": activity.lesson_id,
+                "activity_id": activity.id,
+                "status": "completed" if passed else "attempted",
+                "score": score,
+            },
+        )
+    )
+    if passed and next_id is not None:
+        await db.execute(
+            build_progress_upsert(
+                dialect,
+                {
+                    "user_id": payload.user_id,
+                    "lesson_id": next_id,
+                    "activity_id": None,
+                    "status": "unlocked",
+                    "score": None,
+                },
+                keep_existing=True,
+            )
+        )
+    await db.commit()
+    invalidate_progress_cache(payload.user_id)
+    return {
+        "score": score,
+        "correct": correct,
+        "total": len(questions),
+        "passed": passed,
+        "next_lesson_id": next_id if passed else None,
+    }
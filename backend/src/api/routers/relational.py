@@ -0,0 +1,968 @@
+"""CRUD endpoints for the Subject -> Module -> Lesson -> Activity tree.
+
+List endpoints use keyset (seek) pagination: clients pass back the
+opaque ``cursor`` from the previous page and the database seeks straight
+to the next ``(order_key, id)`` via the index, instead of counting and
+skipping OFFSET rows it will never return.
+"""
+
+import base64
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import lambda_stmt, or_, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, selectinload
+
+from ...db.models import Activity, ActivityType, Lesson, Module, Subject
+from ..dependencies import get_async_db, require_admin
+from .quiz_ai import _answer_key
+from ..relational_schemas import (
+    ActivityCreate,
+    ActivityRead,
+    ActivitySummary,
+    ActivityUpdate,
+    LessonCreate,
+    LessonRead,
+    LessonSummary,
+    LessonUpdate,
+    ModuleCreate,
+    ModuleRead,
+    ModuleUpdate,
+    Page,
+    SubjectCreate,
+    SubjectRead,
+    SubjectUpdate,
+)
+
+router = APIRouter(prefix="/curriculum", tags=["curriculum"])
+
+# ORM hydration batch for list pages: yield_per keeps the ORM from
+# materializing the whole page's identity-map state in one pass (and
+# requests a server-side cursor on drivers that have one), so peak
+# memory tracks the batch, not the page. Compatible with selectinload,
+# which is the only eager loader these statements use.
+_HYDRATE_BATCH = 50
+
+
+# ---------------------------------------------------------------------------
+# Keyset pagination
+# ---------------------------------------------------------------------------
+
+
+def _encode_cursor(order_key: Any, row_id: int) -> str:
+    return base64.urlsafe_b64encode(orjson.dumps([order_key, row_id])).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[Any, int]:
+    try:
+        order_key, row_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Malformed cursor")
+    return order_key, row_id
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt,
+    order_col,
+    id_col,
+    cursor: Optional[str],
+    page_size: int,
+    order_key_of: Callable[[Any], Any],
+):
+    """Fetch one keyset page plus a lookahead row.
+
+    The cursor encodes the last seen ``(order_key, id)``; the seek
+    predicate ``(order_col, id) > (:k, :id)`` is an index range scan, so
+    page N costs the same as page 1. Fetching ``page_size + 1`` rows
+    tells us whether a next page exists without a COUNT.
+
+    ``stmt`` is a lambda statement; the seek and ordering clauses join it
+    through ``add_criteria`` with explicit ``track_on`` keys so the
+    cursor values stay bound parameters under the same cached compile.
+    """
+    if cursor is not None:
+        key, row_id = _decode_cursor(cursor)
+        seek = tuple_(order_col, id_col) > tuple_(key, row_id)
+        stmt = stmt.add_criteria(lambda s: s.where(seek), track_on=[seek])
+    lim = page_size + 1
+    stmt = stmt.add_criteria(
+        lambda s: s.order_by(order_col, id_col).limit(lim),
+        track_on=[order_col, id_col, lim],
+    )
+    result = await db.stream(
+        stmt, execution_options={"yield_per": _HYDRATE_BATCH}
+    )
+    rows = await result.scalars().all()
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = _encode_cursor(order_key_of(last), last.id)
+    return rows, next_cursor
+
+
+def _parse_term(term: str) -> Tuple[str, str]:
+    """Classify a search term into its cheapest predicate shape.
+
+    ``=term`` compares for equality, a term with ``*`` wildcards becomes
+    an ILIKE with ``*`` mapped to ``%`` (trailing-only ``*`` stays a
+    B-tree-friendly prefix LIKE), and a bare term is treated as a
+    prefix — substring searches opt in with ``*term*``. Returns
+    ``(mode, value)`` with mode in {"exact", "prefix", "like"}.
+    """
+    if term.startswith("="):
+        return "exact", term[1:]
+    if term.endswith("*") and "*" not in term[:-1]:
+        return "prefix", term[:-1]
+    if "*" in term:
+        return "like", term.replace("*", "%")
+    return "prefix", term
+
+
+# One fixed lambda per (entity, term shape): search and non-search
+# requests hit distinct cached compilations, the term travels as a bound
+# parameter, and Postgres keeps one prepared plan per shape instead of
+# one per search string. Written out per entity because lambda caching
+# keys on code identity — a generic helper closing over column objects
+# would defeat it.
+def _subject_search(stmt, term: str):
+    mode, value = _parse_term(term)
+    if mode == "exact":
+        stmt += lambda s: s.where(
+            or_(Subject.slug == value, Subject.title == value)
+        )
+    elif mode == "prefix":
+        stmt += lambda s: s.where(
+            or_(Subject.slug.startswith(value), Subject.title.startswith(value))
+        )
+    else:
+        stmt += lambda s: s.where(
+            or_(Subject.slug.ilike(value), Subject.title.ilike(value))
+        )
+    return stmt
+
+
+def _module_search(stmt, term: str):
+    mode, value = _parse_term(term)
+    if mode == "exact":
+        stmt += lambda s: s.where(or_(Module.slug == value, Module.title == value))
+    elif mode == "prefix":
+        stmt += lambda s: s.where(
+            or_(Module.slug.startswith(value), Module.title.startswith(value))
+        )
+    else:
+        stmt += lambda s: s.where(
+            or_(Module.slug.ilike(value), Module.title.ilike(value))
+        )
+    return stmt
+
+
+def _lesson_search(stmt, term: str):
+    mode, value = _parse_term(term)
+    if mode == "exact":
+        stmt += lambda s: s.where(or_(Lesson.slug == value, Lesson.title == value))
+    elif mode == "prefix":
+        stmt += lambda s: s.where(
+            or_(Lesson.slug.startswith(value), Lesson.title.startswith(value))
+        )
+    else:
+        stmt += lambda s: s.where(
+            or_(Lesson.slug.ilike(value), Lesson.title.ilike(value))
+        )
+    return stmt
+
+
+def _is_fk_violation(exc: IntegrityError) -> bool:
+    """True when the driver error under an IntegrityError is an FK violation.
+
+    Postgres drivers expose SQLSTATE 23503 (asyncpg: ``sqlstate``,
+    psycopg2: ``pgcode``); SQLite only gives message text.
+    """
+    orig = exc.orig
+    code = getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)
+    if code is not None:
+        return code == "23503"
+    return "foreign key" in str(orig).lower()
+
+
+async def _insert_or_conflict(
+    db: AsyncSession,
+    model,
+    values: Dict[str, Any],
+    conflict_detail: str,
+    fk_detail: Optional[str] = None,
+):
+    """Create a slugged row with one INSERT ... ON CONFLICT DO NOTHING.
+
+    Replaces the SELECT-then-INSERT pair: the unique slug index
+    arbitrates, RETURNING hands back the stored row (server-default
+    timestamps included), and "no row returned" means conflict — no
+    extra round-trip and no TOCTOU window between check and insert. A
+    dangling parent id surfaces as the INSERT's own FK violation and
+    maps to 400, so there is no pre-flight parent SELECT either.
+    """
+    insert_fn = sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    stmt = (
+        insert_fn(model)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=["slug"])
+        .returning(model)
+    )
+    try:
+        row = (await db.execute(stmt)).scalars().first()
+    except IntegrityError as exc:
+        await db.rollback()
+        if fk_detail is not None and _is_fk_violation(exc):
+            raise HTTPException(status_code=400, detail=fk_detail)
+        raise
+    if row is None:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail=conflict_detail)
+    await db.commit()
+    return row
+
+
+async def _flush_or_400(db: AsyncSession, fk_detail: str) -> None:
+    """Flush pending changes, mapping an FK violation to a 400."""
+    try:
+        await db.flush()
+    except IntegrityError as exc:
+        await db.rollback()
+        if _is_fk_violation(exc):
+            raise HTTPException(status_code=400, detail=fk_detail)
+        raise
+
+
+# One soft delete = one UPDATE: the is_deleted predicate makes rowcount
+# distinguish "gone or never existed" (404) without a prior SELECT, and
+# synchronize_session=False skips identity-map scans for rows this
+# session never loaded.
+async def _soft_delete_or_404(db: AsyncSession, model, row_id: int, detail: str) -> None:
+    result = await db.execute(
+        update(model)
+        .where(model.id == row_id, model.is_deleted == False)  # noqa: E712
+        .values(is_deleted=True)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        await db.rollback()
+        raise HTTPException(status_code=404, detail=detail)
+    await db.commit()
+
+
+# ---------------------------------------------------------------------------
+# Subjects
+# ---------------------------------------------------------------------------
+
+
+# One selectinload per level keeps nested reads at O(depth) queries
+# regardless of row count, and the .and_() criteria push the is_deleted
+# filter into those child SELECTs so deleted rows never reach the
+# response models. Serialization itself is response_model validation
+# straight off the ORM rows (from_attributes), so there is no hand-built
+# mapper layer between the query and the wire.
+_SUBJECT_TREE_LOAD = (
+    selectinload(Subject.modules.and_(Module.is_deleted == False))  # noqa: E712
+    .selectinload(Module.lessons.and_(Lesson.is_deleted == False))  # noqa: E712
+    .selectinload(Lesson.activities.and_(Activity.is_deleted == False))  # noqa: E712
+)
+_MODULE_TREE_LOAD = selectinload(
+    Module.lessons.and_(Lesson.is_deleted == False)  # noqa: E712
+).selectinload(Lesson.activities.and_(Activity.is_deleted == False))  # noqa: E712
+
+# List projections: load_only keeps the heavy columns (lesson content,
+# quiz question blobs) out of the SELECT entirely, so Postgres skips the
+# TOAST detoast and the rows validate into the *Summary schemas.
+_ACTIVITY_SUMMARY_LOAD = load_only(
+    Activity.id,
+    Activity.lesson_id,
+    Activity.title,
+    Activity.type,
+    Activity.order_index,
+    Activity.quiz_pass_score,
+    Activity.created_at,
+    Activity.updated_at,
+)
+_LESSON_SUMMARY_LOAD = load_only(
+    Lesson.id,
+    Lesson.module_id,
+    Lesson.slug,
+    Lesson.title,
+    Lesson.order_index,
+    Lesson.created_at,
+    Lesson.updated_at,
+)
+_LESSON_TREE_SUMMARY_LOAD = selectinload(
+    Lesson.activities.and_(Activity.is_deleted == False)  # noqa: E712
+).load_only(
+    Activity.id,
+    Activity.lesson_id,
+    Activity.title,
+    Activity.type,
+    Activity.order_index,
+    Activity.quiz_pass_score,
+    Activity.created_at,
+    Activity.updated_at,
+)
+
+
+# Hot list statements as lambda statements: SQLAlchemy keys the compiled
+# SQL on the lambdas' code identity, so steady-state list requests reuse
+# the cached compilation and closure scalars travel as bound parameters.
+# Optional filters compose with ``+=``; each combination of applied
+# lambdas is its own cache entry.
+def _subject_list_stmt():
+    return lambda_stmt(
+        lambda: select(Subject).where(Subject.is_deleted == False)  # noqa: E712
+    )
+
+
+def _module_list_stmt(subject_id: int):
+    return lambda_stmt(
+        lambda: select(Module).where(
+            Module.subject_id == subject_id,
+            Module.is_deleted == False,  # noqa: E712
+        )
+    )
+
+
+def _lesson_list_stmt(module_id: int):
+    return lambda_stmt(
+        lambda: select(Lesson).where(
+            Lesson.module_id == module_id,
+            Lesson.is_deleted == False,  # noqa: E712
+        )
+    )
+
+
+def _activity_list_stmt():
+    return lambda_stmt(
+        lambda: select(Activity).where(Activity.is_deleted == False)  # noqa: E712
+    )
+
+
+@router.get("/subjects", response_model=Page[SubjectRead])
+async def list_subjects(
+    pattern: Optional[str] = None,
+    include_nested: bool = False,
+    cursor: Optional[str] = None,
+    page_size: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+):
+    stmt = _subject_list_stmt()
+    if include_nested:
+        stmt += lambda s: s.options(_SUBJECT_TREE_LOAD)
+    if pattern is not None:
+        stmt = _subject_search(stmt, pattern)
+    rows, next_cursor = await paginate(
+        db, stmt, Subject.title, Subject.id, cursor, page_size, lambda s: s.title
+    )
+    return {"items": rows, "next_cursor": next_cursor}
+
+
+async def _current_etag(
+    db: AsyncSession, model, row_id: int, detail: str
+) -> str:
+    """Compute the row's weak ETag from a cheap updated_at probe.
+
+    (id, updated_at) changes whenever the row does, so revalidations can
+    short-circuit before the full row — or, for nested reads, the whole
+    subtree — is fetched. Raises 404 for missing or deleted rows.
+    """
+    updated_at = (
+        await db.execute(
+            select(model.updated_at).where(
+                model.id == row_id, model.is_deleted == False  # noqa: E712
+            )
+        )
+    ).scalar()
+    if updated_at is None:
+        raise HTTPException(status_code=404, detail=detail)
+    return 'W/"%d-%d"' % (row_id, int(updated_at.timestamp()))
+
+
+# Nested subject reads as one round-trip: the database assembles the
+# whole tree as a single JSON value (children aggregated in order_index
+# order, deleted rows filtered in SQL) and the handler streams the bytes
+# straight through — no selectinload fan-out and no Pydantic tree
+# construction. The ::text cast keeps asyncpg from deserializing the
+# jsonb just for us to re-serialize it. Dialects without a statement
+# here fall back to the ORM loader path.
+_SUBJECT_TREE_SQL = {
+    "postgresql": text(
+        """
+        SELECT jsonb_build_object(
+            'id', s.id, 'slug', s.slug, 'title', s.title,
+            'description', s.description,
+            'created_at', s.created_at, 'updated_at', s.updated_at,
+            'modules', COALESCE((
+                SELECT jsonb_agg(jsonb_build_object(
+                    'id', m.id, 'subject_id', m.subject_id, 'slug', m.slug,
+                    'title', m.title, 'description', m.description,
+                    'order_index', m.order_index,
+                    'created_at', m.created_at, 'updated_at', m.updated_at,
+                    'lessons', COALESCE((
+                        SELECT jsonb_agg(jsonb_build_object(
+                            'id', l.id, 'module_id', l.module_id,
+                            'slug', l.slug, 'title', l.title,
+                            'content', l.content, 'order_index', l.order_index,
+                            'created_at', l.created_at,
+                            'updated_at', l.updated_at,
+                            'activities', COALESCE((
+                                SELECT jsonb_agg(jsonb_build_object(
+                                    'id', a.id, 'lesson_id', a.lesson_id,
+                                    'title', a.title,
+                                    'type', CASE a.type
+                                        WHEN 2 THEN 'quiz'
+                                        ELSE 'content' END,
+                                    'order_index', a.order_index,
+                                    'content', a.content,
+                                    'quiz_questions', a.quiz_questions,
+                                    'quiz_pass_score', a.quiz_pass_score,
+                                    'created_at', a.created_at,
+                                    'updated_at', a.updated_at
+                                ) ORDER BY a.order_index, a.id)
+                                FROM activities a
+                                WHERE a.lesson_id = l.id AND NOT a.is_deleted
+                            ), '[]'::jsonb)
+                        ) ORDER BY l.order_index, l.id)
+                        FROM lessons l
+                        WHERE l.module_id = m.id AND NOT l.is_deleted
+                    ), '[]'::jsonb)
+                ) ORDER BY m.order_index, m.id)
+                FROM modules m
+                WHERE m.subject_id = s.id AND NOT m.is_deleted
+            ), '[]'::jsonb)
+        )::text
+        FROM subjects s WHERE s.id = :id AND NOT s.is_deleted
+        """
+    ),
+    # SQLite stores datetimes as "YYYY-MM-DD HH:MM:SS" text, which would
+    # pass straight through the JSON functions; strftime rewrites the
+    # timestamps as the ISO-8601 the response schema documents (and the
+    # Postgres statement emits).
+    "sqlite": text(
+        """
+        SELECT json_object(
+            'id', s.id, 'slug', s.slug, 'title', s.title,
+            'description', s.description,
+            'created_at', strftime('%Y-%m-%dT%H:%M:%S', s.created_at),
+            'updated_at', strftime('%Y-%m-%dT%H:%M:%S', s.updated_at),
+            'modules', json(COALESCE((
+                SELECT json_group_array(json(mrow.obj)) FROM (
+                    SELECT json_object(
+                        'id', m.id, 'subject_id', m.subject_id,
+                        'slug', m.slug, 'title', m.title,
+                        'description', m.description,
+                        'order_index', m.order_index,
+                        'created_at',
+                            strftime('%Y-%m-%dT%H:%M:%S', m.created_at),
+                        'updated_at',
+                            strftime('%Y-%m-%dT%H:%M:%S', m.updated_at),
+                        'lessons', json(COALESCE((
+                            SELECT json_group_array(json(lrow.obj)) FROM (
+                                SELECT json_object(
+                                    'id', l.id, 'module_id', l.module_id,
+                                    'slug', l.slug, 'title', l.title,
+                                    'content', l.content,
+                                    'order_index', l.order_index,
+                                    'created_at',
+                                        strftime('%Y-%m-%dT%H:%M:%S',
+                                                 l.created_at),
+                                    'updated_at',
+                                        strftime('%Y-%m-%dT%H:%M:%S',
+                                                 l.updated_at),
+                                    'activities', json(COALESCE((
+                                        SELECT json_group_array(json(arow.obj))
+                                        FROM (
+                                            SELECT json_object(
+                                                'id', a.id,
+                                                'lesson_id', a.lesson_id,
+                                                'title', a.title,
+                                                'type', CASE a.type
+                                                    WHEN 2 THEN 'quiz'
+                                                    ELSE 'content' END,
+                                                'order_index', a.order_index,
+                                                'content', a.content,
+                                                'quiz_questions',
+                                                    json(a.quiz_questions),
+                                                'quiz_pass_score',
+                                                    a.quiz_pass_score,
+                                                'created_at',
+                                                    strftime(
+                                                        '%Y-%m-%dT%H:%M:%S',
+                                                        a.created_at),
+                                                'updated_at',
+                                                    strftime(
+                                                        '%Y-%m-%dT%H:%M:%S',
+                                                        a.updated_at)
+                                            ) AS obj
+                                            FROM activities a
+                                            WHERE a.lesson_id = l.id
+                                              AND a.is_deleted = 0
+                                            ORDER BY a.order_index, a.id
+                                        ) arow
+                                    ), '[]'))
+                                ) AS obj
+                                FROM lessons l
+                                WHERE l.module_id = m.id AND l.is_deleted = 0
+                                ORDER BY l.order_index, l.id
+                            ) lrow
+                        ), '[]'))
+                    ) AS obj
+                    FROM modules m
+                    WHERE m.subject_id = s.id AND m.is_deleted = 0
+                    ORDER BY m.order_index, m.id
+                ) mrow
+            ), '[]'))
+        )
+        FROM subjects s WHERE s.id = :id AND s.is_deleted = 0
+        """
+    ),
+}
+
+
+@router.get("/subjects/{subject_id}", response_model=SubjectRead)
+async def get_subject(
+    subject_id: int,
+    request: Request,
+    response: Response,
+    include_nested: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+):
+    etag = await _current_etag(db, Subject, subject_id, "Subject not found")
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    if include_nested:
+        tree_sql = _SUBJECT_TREE_SQL.get(db.get_bind().dialect.name)
+        if tree_sql is not None:
+            doc = (await db.execute(tree_sql, {"id": subject_id})).scalar()
+            if doc is None:
+                raise HTTPException(status_code=404, detail="Subject not found")
+            return Response(
+                content=doc,
+                media_type="application/json",
+                headers={"ETag": etag},
+            )
+    stmt = select(Subject).where(
+        Subject.id == subject_id, Subject.is_deleted == False  # noqa: E712
+    )
+    if include_nested:
+        stmt = stmt.options(_SUBJECT_TREE_LOAD)
+    subject = (await db.execute(stmt)).scalars().first()
+    if subject is None:
+        raise HTTPException(status_code=404, detail="Subject not found")
+    return subject
+
+
+@router.post("/subjects", response_model=SubjectRead, status_code=201)
+async def create_subject(
+    payload: SubjectCreate,
+    db: AsyncSession = Depends(get_async_db),
+    claims: dict = Depends(require_admin),
+):
+    return await _insert_or_conflict(
+        db, Subject, payload.model_dump(), "Subject slug already exists"
+    )
+
+
+@router.put("/subjects/{subject_id}", response_model=SubjectRead)
+async def update_subject(
+    subject_id: int,
+    updates: SubjectUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    claims: dict = Depends(require_admin),
+):
+    subject = await db.get(Subject, subject_id)
+    if subject is None or subject.is_deleted:
+        raise HTTPException(status_code=404, detail="Subject not found")
+    for field, value in updates.model_dump(exclude_unset=True).items():
+        setattr(subject, field, value)
+    await db.flush()
+    await db.commit()
+    return subject
+
+
+@router.delete("/subjects/{subject_id}", status_code=204)
+async def delete_subject(
+    subject_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    claims: dict = Depends(require_admin),
+):
+    result = await db.execute(
+        update(Subject)
+        .where(Subject.id == subject_id, Subject.is_deleted == False)  # noqa: E712
+        .values(is_deleted=True)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        await db.rollback()
+        raise HTTPException(status_code=404, detail="Subject not found")
+    # Propagate to the subtree with three set-based UPDATEs over id
+    # subqueries (deepest first) instead of loading every child row into
+    # the ORM; synchronize_session=False skips identity-map bookkeeping
+    # for rows this session never loaded. Data-modifying CTEs would fold
+    # these into one statement on Postgres but don't exist on SQLite.
+    module_ids = select(Module.id).where(Module.subject_id == subject_id)
+    lesson_ids = select(Lesson.id).where(Lesson.module_id.in_(module_ids))
+    await db.execute(
+        update(Activity)
+        .where(Activity.lesson_id.in_(lesson_ids))
+        .values(is_deleted=True)
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(
+        update(Lesson)
+        .where(Lesson.module_id.in_(module_ids))
+        .values(is_deleted=True)
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(
+        update(Module)
+        .where(Module.subject_id == subject_id)
+        .values(is_deleted=True)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+
+# ---------------------------------------------------------------------------
+# Modules
+# ---------------------------------------------------------------------------
+
+
+@router.get("/subjects/{subject_id}/modules", response_model=Page[ModuleRead])
+async def list_modules_for_subject(
+    subject_id: int,
+    pattern: Optional[str] = None,
+    include_nested: bool = False,
+    cursor: Optional[str] = None,
+    page_size: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+):
+    stmt = _module_list_stmt(subject_id)
+    if include_nested:
+        stmt += lambda s: s.options(_MODULE_TREE_LOAD)
+    if pattern is not None:
+        stmt = _module_search(stmt, pattern)
+    rows, next_cursor = await paginate(
+        db,
+        stmt,
+        Module.order_index,
+        Module.id,
+        cursor,
+        page_size,
+        lambda m: m.order_index,
+    )
+    return {"items": rows, "next_cursor": next_cursor}
+
+
+@router.get("/modules/{module_id}", response_model=ModuleRead)
+async def get_module(
+    module_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
+    etag = await _current_etag(db, Module, module_id, "Module not found")
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    module = await db.get(Module, module_id)
+    if module is None or module.is_deleted:
+        raise HTTPException(status_code=404, detail="Module not found")
+    response.headers["ETag"] = etag
+    return module
+
+
+@router.post("/modules", response_model=ModuleRead, status_code=201)
+async def create_module(
+    payload: ModuleCreate,
+    db: AsyncSession = Depends(get_async_db),
+    claims: dict = Depends(require_admin),
+):
+    return await _insert_or_conflict(
+        db,
+        Module,
+        payload.model_dump(),
+        "Module slug already exists",
+        fk_detail="Invalid subject_id",
+    )
+
+
+@router.put("/modules/{module_id}", response_model=ModuleRead)
+async def update_module(
+    module_id: int,
+    updates: ModuleUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    claims: dict = Depends(require_admin),
+):
+    module = await db.get(Module, module_id)
+    if module is None or module.is_deleted:
+        raise HTTPException(status_code=404, detail="Module not found")
+    for field, value in updates.model_dump(exclude_unset=True).items():
+        setattr(module, field, value)
+    await _flush_or_400(db, "Invalid subject_id")
+    await db.commit()
+    return module
+
+
+@router.delete("/modules/{module_id}", status_code=204)
+async def delete_module(
+    module_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    claims: dict = Depends(require_admin),
+):
+    await _soft_delete_or_404(db, Module, module_id, "Module not found")
+
+
+# ---------------------------------------------------------------------------
+# Lessons
+# ---------------------------------------------------------------------------
+
+
+@router.get("/modules/{module_id}/lessons", response_model=Page[LessonSummary])
+async def list_lessons_for_module(
+    module_id: int,
+    pattern: Optional[str] = None,
+    include_nested: bool = False,
+    cursor: Optional[str] = None,
+    page_size: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+):
+    stmt = _lesson_list_stmt(module_id)
+    stmt += lambda s: s.options(_LESSON_SUMMARY_LOAD)
+    if include_nested:
+        stmt += lambda s: s.options(_LESSON_TREE_SUMMARY_LOAD)
+    if pattern is not None:
+        stmt = _lesson_search(stmt, pattern)
+    rows, next_cursor = await paginate(
+        db,
+        stmt,
+        Lesson.order_index,
+        Lesson.id,
+        cursor,
+        page_size,
+        lambda lesson: lesson.order_index,
+    )
+    return {"items": rows, "next_cursor": next_cursor}
+
+
+@router.get("/lessons/{lesson_id}", response_model=LessonRead)
+async def get_lesson(
+    lesson_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
+    etag = await _current_etag(db, Lesson, lesson_id, "Lesson not found")
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    lesson = await db.get(Lesson, lesson_id)
+    if lesson is None or lesson.is_deleted:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    response.headers["ETag"] = etag
+    return lesson
+
+
+@router.post("/lessons", response_model=LessonRead, status_code=201)
+async def create_lesson(
+    payload: LessonCreate,
+    db: AsyncSession = Depends(get_async_db),
+    claims: dict = Depends(require_admin),
+):
+    return await _insert_or_conflict(
+        db,
+        Lesson,
+        payload.model_dump(),
+        "Lesson slug already exists",
+        fk_detail="Invalid module_id",
+    )
+
+
+@router.put("/lessons/{lesson_id}", response_model=LessonRead)
+async def update_lesson(
+    lesson_id: int,
+    updates: LessonUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    claims: dict = Depends(require_admin),
+):
+    lesson = await db.get(Lesson, lesson_id)
+    if lesson is None or lesson.is_deleted:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    for field, value in updates.model_dump(exclude_unset=True).items():
+        setattr(lesson, field, value)
+    await _flush_or_400(db, "Invalid module_id")
+    await db.commit()
+    return lesson
+
+
+@router.delete("/lessons/{lesson_id}", status_code=204)
+async def delete_lesson(
+    lesson_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    claims: dict = Depends(require_admin),
+):
+    await _soft_delete_or_404(db, Lesson, lesson_id, "Lesson not found")
+
+
+# ---------------------------------------------------------------------------
+# Activities (and the /quizzes alias)
+# ---------------------------------------------------------------------------
+
+
+# The /quizzes routes are aliases over activities; both route families
+# call these impl helpers directly instead of re-entering the sibling
+# handler (which would re-run dependency resolution and, for creates,
+# re-validate an already-validated payload).
+_ACTIVITY_TYPE_CODES = {t.name.lower(): int(t) for t in ActivityType}
+
+
+def _activity_type_code(name: str) -> int:
+    """Map a wire type name onto its stored integer code."""
+    try:
+        return _ACTIVITY_TYPE_CODES[name]
+    except KeyError:
+        raise HTTPException(status_code=400, detail="Unknown activity type")
+
+
+async def _list_activities_impl(
+    db: AsyncSession,
+    lesson_id: Optional[int],
+    type_: Optional[str],
+    cursor: Optional[str],
+    page_size: int,
+):
+    stmt = _activity_list_stmt()
+    stmt += lambda s: s.options(_ACTIVITY_SUMMARY_LOAD)
+    if lesson_id is not None:
+        stmt += lambda s: s.where(Activity.lesson_id == lesson_id)
+    if type_ is not None:
+        code = _activity_type_code(type_)
+        stmt += lambda s: s.where(Activity.type == code)
+    rows, next_cursor = await paginate(
+        db,
+        stmt,
+        Activity.order_index,
+        Activity.id,
+        cursor,
+        page_size,
+        lambda a: a.order_index,
+    )
+    return {"items": rows, "next_cursor": next_cursor}
+
+
+async def _create_activity_impl(db: AsyncSession, values: Dict[str, Any]) -> Activity:
+    values["type"] = _activity_type_code(values.get("type", "content"))
+    activity = Activity(**values)
+    db.add(activity)
+    await _flush_or_400(db, "Invalid lesson_id")
+    await db.commit()
+    return activity
+
+
+@router.get("/activities", response_model=Page[ActivitySummary])
+async def list_activities(
+    lesson_id: Optional[int] = None,
+    type: Optional[str] = None,
+    cursor: Optional[str] = None,
+    page_size: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await _list_activities_impl(db, lesson_id, type, cursor, page_size)
+
+
+@router.get("/activities/{activity_id}", response_model=ActivityRead)
+async def get_activity(
+    activity_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
+    etag = await _current_etag(db, Activity, activity_id, "Activity not found")
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    activity = await db.get(Activity, activity_id)
+    if activity is None or activity.is_deleted:
+        raise HTTPException(status_code=404, detail="Activity not found")
+    response.headers["ETag"] = etag
+    return activity
+
+
+@router.post("/activities", response_model=ActivityRead, status_code=201)
+async def create_activity(
+    payload: ActivityCreate,
+    db: AsyncSession = Depends(get_async_db),
+    claims: dict = Depends(require_admin),
+):
+    return await _create_activity_impl(db, payload.model_dump())
+
+
+@router.put("/activities/{activity_id}", response_model=ActivityRead)
+async def update_activity(
+    activity_id: int,
+    updates: ActivityUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    claims: dict = Depends(require_admin),
+):
+    activity = await db.get(Activity, activity_id)
+    if activity is None or activity.is_deleted:
+        raise HTTPException(status_code=404, detail="Activity not found")
+    data = updates.model_dump(exclude_unset=True)
+    for field, value in data.items():
+        if field == "type":
+            value = _activity_type_code(value)
+        setattr(activity, field, value)
+    if "quiz_questions" in data:
+        # The quiz read path serves quiz_questions_json verbatim and
+        # grading compares against answer_key, so both must follow an
+        # edit or the old questions keep being served and scored. The
+        # generation cache_key no longer describes these questions;
+        # clear it so generators don't treat the edit as a cache hit.
+        questions = data["quiz_questions"]
+        if questions is not None:
+            activity.quiz_questions_json = orjson.dumps(questions)
+            activity.answer_key = _answer_key(questions)
+        else:
+            activity.quiz_questions_json = None
+            activity.answer_key = None
+        activity.cache_key = None
+    await db.flush()
+    await db.commit()
+    return activity
+
+
+@router.delete("/activities/{activity_id}", status_code=204)
+async def delete_activity(
+    activity_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    claims: dict = Depends(require_admin),
+):
+    await _soft_delete_or_404(db, Activity, activity_id, "Activity not found")
+
+
+@router.get("/quizzes", response_model=Page[ActivitySummary])
+async def list_quizzes(
+    lesson_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    page_size: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await _list_activities_impl(db, lesson_id, "quiz", cursor, page_size)
+
+
+@router.post("/quizzes", response_model=ActivityRead, status_code=201)
+async def create_quiz(
+    payload: ActivityCreate,
+    db: AsyncSession = Depends(get_async_db),
+    claims: dict = Depends(require_admin),
+):
+    values = payload.model_dump()
+    values["type"] = "quiz"
+    return await _create_activity_impl(db, values)
@@ -0,0 +1,210 @@
+"""Progressive skill endpoints over the relational models (async)."""
+
+from typing import List, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import insert, lambda_stmt, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...db.models import Module, Skill, Subject
+from ..dependencies import get_async_db, require_admin
+from ..relational_schemas import SkillCreate, SkillRead, SkillUpdate
+
+router = APIRouter(prefix="/v2/skills", tags=["skills-v2"])
+
+
+class SkillSummary(BaseModel):
+    id: int
+    slug: str
+    name: str
+    level: Optional[str] = None
+    description: Optional[str] = None
+
+    @classmethod
+    def from_skill(cls, skill: Skill) -> "SkillSummary":
+        # model_construct: the source is our own ORM row, so field
+        # validation would only re-check what the schema enforced on
+        # the way in.
+        return cls.model_construct(
+            id=skill.id,
+            slug=skill.slug,
+            name=skill.name,
+            level=skill.level,
+            description=skill.description,
+        )
+
+
+# Raw dicts straight to orjson on the list path: the rows are our own
+# trusted data, so running each through a response model only re-validates
+# what the database already guarantees. Schema stays documented via
+# `responses`.
+@router.get("", responses={200: {"model": List[SkillSummary]}})
+async def list_skills(
+    subject_slug: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_async_db),
+):
+    # Project only the summary columns instead of hydrating full Skill
+    # instances: no InstanceState bookkeeping per row and nothing fetched
+    # that the response doesn't ship.
+    stmt = select(
+        Skill.id, Skill.slug, Skill.name, Skill.level, Skill.description
+    ).where(Skill.is_deleted == False)  # noqa: E712
+    if subject_slug is not None:
+        # Subject slug resolves inside the same statement; an unknown
+        # slug yields zero rows naturally, with no separate lookup or
+        # early-return branch.
+        subject_id = (
+            select(Subject.id)
+            .where(
+                Subject.slug == subject_slug,
+                Subject.is_deleted == False,  # noqa: E712
+            )
+            .scalar_subquery()
+        )
+        stmt = stmt.where(Skill.subject_id == subject_id)
+    result = await db.execute(
+        stmt.order_by(Skill.created_at).limit(limit).offset(offset)
+    )
+    return ORJSONResponse(content=[dict(r._mapping) for r in result.all()])
+
+
+@router.get("/export")
+async def export_skills(db: AsyncSession = Depends(get_async_db)):
+    """Stream the full catalog as NDJSON for background consumers.
+
+    Server-side streaming keeps memory bounded: rows arrive in
+    ``yield_per``-sized batches and each is serialized and flushed as one
+    line, so the first byte goes out before the last row is read.
+    """
+    stmt = (
+        select(
+            Skill.id,
+            Skill.slug,
+            Skill.name,
+            Skill.category,
+            Skill.level,
+            Skill.description,
+            Skill.tags,
+            Skill.created_at,
+        )
+        .where(Skill.is_deleted == False)  # noqa: E712
+        .order_by(Skill.id)
+        .execution_options(stream_results=True, yield_per=500)
+    )
+    result = await db.stream(stmt)
+
+    async def gen():
+        async for row in result:
+            yield orjson.dumps(dict(row._mapping)) + b"\n"
+
+    return StreamingResponse(gen(), media_type="application/x-ndjson")
+
+
+def _skill_by_slug_stmt(slug: str):
+    # Compiled once per statement shape via lambda_stmt; per request only
+    # the slug bind changes.
+    return lambda_stmt(
+        lambda: select(Skill).where(
+            Skill.slug == slug, Skill.is_deleted == False  # noqa: E712
+        )
+    )
+
+
+@router.get("/{slug}", response_model=SkillRead)
+async def get_skill(slug: str, db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(_skill_by_slug_stmt(slug))
+    skill = result.scalars().first()
+    if skill is None:
+        raise HTTPException(status_code=404, detail="Skill not found")
+    return skill
+
+
+@router.post("", response_model=SkillRead, status_code=201)
+async def create_skill(
+    payload: SkillCreate,
+    db: AsyncSession = Depends(get_async_db),
+    claims: dict = Depends(require_admin),
+):
+    # SELECT 1 ... LIMIT 1 instead of fetching a row: the database stops
+    # at the first match and returns no column data on a hit.
+    existing = await db.execute(
+        select(literal(1)).where(Skill.slug == payload.slug).limit(1)
+    )
+    if existing.first() is not None:
+        raise HTTPException(status_code=409, detail="Skill slug already exists")
+    # INSERT ... RETURNING replaces the add/commit/refresh INSERT+SELECT.
+    result = await db.execute(
+        insert(Skill).values(**payload.model_dump()).returning(Skill)
+    )
+    skill = result.scalar_one()
+    await db.commit()
+    return skill
+
+
+@router.put("/{slug}", response_model=SkillRead)
+async def update_skill(
+    slug: str,
+    updates: SkillUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    claims: dict = Depends(require_admin),
+):
+    # Typed payload + one UPDATE ... RETURNING: pydantic whitelists and
+    # coerces the fields, replacing the hasattr/setattr loop and its
+    # SELECT/flush/refresh round-trips.
+    changes = updates.model_dump(exclude_unset=True)
+    if not changes:
+        return await get_skill(slug, db)
+    result = await db.execute(
+        update(Skill)
+        .where(Skill.slug == slug, Skill.is_deleted == False)  # noqa: E712
+        .values(**changes)
+        .returning(Skill)
+    )
+    skill = result.scalars().first()
+    if skill is None:
+        raise HTTPException(status_code=404, detail="Skill not found")
+    await db.commit()
+    return skill
+
+
+@router.get("/{skill_slug}/modules")
+async def list_modules_for_skill(
+    skill_slug: str, db: AsyncSession = Depends(get_async_db)
+):
+    # Column projection over a join: one query returning exactly the
+    # fields the response ships, with no Module/Skill instances hydrated.
+    result = await db.execute(
+        select(
+            Module.id,
+            Module.slug,
+            Module.title,
+            Module.description,
+            Module.order_index,
+        )
+        .join(Skill, Skill.id == Module.skill_id)
+        .where(
+            Skill.slug == skill_slug,
+            Skill.is_deleted == False,  # noqa: E712
+            Module.is_deleted == False,  # noqa: E712
+        )
+        .order_by(Module.order_index)
+    )
+    rows = result.all()
+    if not rows:
+        # Empty could mean "no modules yet" or "no such skill"; one cheap
+        # id lookup disambiguates only on this path.
+        exists = await db.execute(
+            select(literal(1))
+            .where(
+                Skill.slug == skill_slug, Skill.is_deleted == False  # noqa: E712
+            )
+            .limit(1)
+        )
+        if exists.first() is None:
+            raise HTTPException(status_code=404, detail="Skill not found")
+    return [dict(r._mapping) for r in rows]
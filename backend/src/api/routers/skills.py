@@ -0,0 +1,20 @@
+"""Legacy /skills routes, aliased onto the consolidated v2 handlers.
+
+One implementation (projected columns, lambda_stmt caching, async
+sessions) now serves both prefixes; this module only registers the old
+paths so existing clients keep working.
+"""
+
+from typing import List
+
+from fastapi import APIRouter
+
+from ..relational_schemas import SkillRead
+from .skill_progressive import SkillSummary, get_skill, list_skills
+
+router = APIRouter(prefix="/skills", tags=["skills"])
+
+router.add_api_route(
+    "", list_skills, methods=["GET"], responses={200: {"model": List[SkillSummary]}}
+)
+router.add_api_route("/{slug}", get_skill, methods=["GET"], response_model=SkillRead)
@@ -0,0 +1,59 @@
+"""Pydantic models for the Mongo-backed catalog documents."""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class QuizQuestionModel(BaseModel):
+    question: str
+    options: List[str] = Field(min_length=2)
+    answerIndex: int = 0
+
+
+class SkillModel(BaseModel):
+    name: str
+    slug: str
+    category: Optional[str] = None
+    categorySlug: Optional[str] = None
+    level: str = "Beginner"
+    description: Optional[str] = None
+    tags: List[str] = []
+
+
+class LessonModel(BaseModel):
+    title: str
+    slug: str
+    skillSlug: str
+    order: int = 1
+    content: Optional[str] = None
+    tags: List[str] = []
+    quiz: Optional[List[QuizQuestionModel]] = None
+
+
+class SkillUpdate(BaseModel):
+    """Partial skill update; only fields the client sent are applied."""
+
+    name: Optional[str] = None
+    category: Optional[str] = None
+    categorySlug: Optional[str] = None
+    level: Optional[str] = None
+    description: Optional[str] = None
+    tags: Optional[List[str]] = None
+
+
+class LessonUpdate(BaseModel):
+    """Partial lesson update; only fields the client sent are applied."""
+
+    title: Optional[str] = None
+    order: Optional[int] = None
+    content: Optional[str] = None
+    tags: Optional[List[str]] = None
+    quiz: Optional[List[QuizQuestionModel]] = None
+
+
+class SkillListResponse(BaseModel):
+    items: List[SkillModel]
+    total: int
+    page: int
+    page_size: int
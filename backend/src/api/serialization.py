@@ -0,0 +1,30 @@
+"""Response content negotiation helpers.
+
+MessagePack support is optional: when ormsgpack is not installed the
+helpers report no msgpack support and endpoints fall back to JSON.
+"""
+
+from typing import Any
+
+from fastapi import Request, Response
+
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover - optional dependency
+    ormsgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+
+
+def wants_msgpack(request: Request) -> bool:
+    """True when the client asked for msgpack and we can produce it."""
+    if ormsgpack is None:
+        return False
+    return MSGPACK_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def msgpack_response(payload: Any) -> Response:
+    return Response(
+        content=ormsgpack.packb(payload, option=ormsgpack.OPT_NAIVE_UTC),
+        media_type=MSGPACK_MEDIA_TYPE,
+    )
@@ -0,0 +1,77 @@
+"""Application configuration loaded from environment variables."""
+
+import json
+import os
+import re
+from functools import lru_cache
+from types import MappingProxyType
+
+
+class Config:
+    """Snapshot of environment-driven settings taken at construction time."""
+
+    def __init__(self) -> None:
+        self.app_name = os.getenv("APP_NAME", "SkillMaster Learning Platform")
+        self.environment = os.getenv("ENVIRONMENT", "development")
+        self.frontend_url = os.getenv("FRONTEND_URL", "http://localhost:3000")
+        self.backend_url = os.getenv("BACKEND_URL", "http://localhost:8000")
+        self.mongodb_uri = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
+        self.mongodb_db = os.getenv("MONGODB_DB", "skillmaster")
+        self.database_url = os.getenv("SQLALCHEMY_DATABASE_URL", "sqlite:///./skillmaster.db")
+        # Read-only view: flags are consulted all over the request path
+        # and must never be mutated behind the shared Config's back.
+        self.feature_flags = MappingProxyType(
+            _parse_feature_flags(os.getenv("FEATURE_FLAGS", ""))
+        )
+
+
+_BOOL_VALUES = {"true": True, "false": False}
+_INT_RE = re.compile(r"-?\d+")
+_FLOAT_RE = re.compile(r"-?\d+\.\d+(?:[eE][+-]?\d+)?")
+
+
+def _parse_feature_flags(value: str):
+    """Parse FEATURE_FLAGS from either a JSON object or a k=v CSV string.
+
+    Tests reload config often, so the parse avoids exception-driven
+    control flow: JSON is only attempted when the value can actually be
+    JSON, and numeric tokens are matched before conversion instead of
+    letting int()/float() raise per token.
+    """
+    if not value:
+        return {}
+    if value.lstrip()[:1] in "{[":
+        try:
+            parsed = json.loads(value)
+        except ValueError:
+            pass
+        else:
+            if isinstance(parsed, dict):
+                return parsed
+    flags = {}
+    for pair in value.split(","):
+        k, sep, v = pair.partition("=")
+        if not sep:
+            continue
+        k = k.strip()
+        v = v.strip()
+        lowered = v.lower()
+        if lowered in _BOOL_VALUES:
+            flags[k] = _BOOL_VALUES[lowered]
+        elif _INT_RE.fullmatch(v):
+            flags[k] = int(v)
+        elif _FLOAT_RE.fullmatch(v):
+            flags[k] = float(v)
+        else:
+            flags[k] = v
+    return flags
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide Config, creating it on first use.
+
+    lru_cache makes the singleton a plain C-level dict hit per call
+    (tests reset it with ``get_config.cache_clear()``).
+    """
+    return Config()
@@ -0,0 +1,324 @@
+"""SQLAlchemy models for the relational content hierarchy.
+
+Subject -> Skill -> Module -> Lesson -> Activity, plus per-user Progress
+rows. Soft deletes use ``is_deleted`` so history survives admin edits.
+"""
+
+from enum import IntEnum
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    SmallInteger,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.orm import relationship
+
+from .sqlalchemy import Base
+
+
+# Partial "active row" indexes: soft-deleted rows accumulate over time,
+# and every read filters them out, so the partial form keeps the index
+# small and lets the slug lookups stay index-only. There is no Alembic in
+# this tree; indexes live in __table_args__ and create_all applies them.
+def _active_slug_index(name: str) -> Index:
+    return Index(
+        name,
+        "slug",
+        postgresql_where=text("is_deleted = false"),
+        sqlite_where=text("is_deleted = 0"),
+    )
+
+
+# Substring search (`ILIKE '%term%'`) can't use a B-tree; on Postgres a
+# trigram GIN index lets the planner serve it with an index scan. The
+# partial predicate matches the is_deleted filter every search carries.
+# Other dialects ignore the postgresql_* options and just get a plain
+# composite index. Extension setup happens in create_all_tables.
+def _search_trgm_index(name: str, *cols: str) -> Index:
+    return Index(
+        name,
+        *cols,
+        postgresql_using="gin",
+        postgresql_ops={col: "gin_trgm_ops" for col in cols},
+        postgresql_where=text("is_deleted = false"),
+    )
+
+
+# Prefix LIKE ('term%') only uses a Postgres B-tree under the C
+# collation; varchar_pattern_ops makes the slug index usable for the
+# prefix searches the curriculum endpoints now emit.
+def _slug_pattern_index(name: str) -> Index:
+    return Index(
+        name,
+        "slug",
+        postgresql_ops={"slug": "varchar_pattern_ops"},
+        postgresql_where=text("is_deleted = false"),
+        sqlite_where=text("is_deleted = 0"),
+    )
+
+
+# Stored form of Activity.type; the API speaks the lowercase names.
+# A 2-byte integer compares cheaper than a varchar in the type filters
+# and keeps the (lesson_id, type, order_index, id) index dense.
+class ActivityType(IntEnum):
+    CONTENT = 1
+    QUIZ = 2
+
+
+class Subject(Base):
+    __tablename__ = "subjects"
+    __table_args__ = (
+        _active_slug_index("ix_subject_slug_active"),
+        _search_trgm_index("ix_subject_search_trgm", "title", "slug"),
+        _slug_pattern_index("ix_subject_slug_pattern"),
+    )
+    # Server-generated timestamps come back on the INSERT/UPDATE's own
+    # RETURNING clause instead of a refresh() SELECT afterwards.
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(Integer, primary_key=True)
+    slug = Column(String(128), unique=True, nullable=False, index=True)
+    title = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+    is_deleted = Column(Boolean, default=False, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    # lazy="noload": response models validate these fields on every
+    # read, so the default stays an empty list and nested reads opt in
+    # with selectinload instead of triggering per-row lazy loads. The
+    # order_by rides along on those child SELECTs, so the database hands
+    # back pre-sorted rows instead of Python sorting each sibling list.
+    modules = relationship(
+        "Module",
+        back_populates="subject",
+        foreign_keys="Module.subject_id",
+        order_by="Module.order_index",
+        lazy="noload",
+    )
+
+
+class Skill(Base):
+    __tablename__ = "skills"
+    __table_args__ = (_active_slug_index("ix_skill_slug_active"),)
+
+    id = Column(Integer, primary_key=True)
+    subject_id = Column(Integer, ForeignKey("subjects.id"), nullable=True)
+    slug = Column(String(128), unique=True, nullable=False, index=True)
+    name = Column(String(255), nullable=False)
+    category = Column(String(128), nullable=True)
+    level = Column(String(32), default="Beginner", nullable=False)
+    description = Column(Text, nullable=True)
+    tags = Column(JSON, default=list)
+    is_deleted = Column(Boolean, default=False, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    # lazy="raise" so an unloaded access fails fast instead of silently
+    # issuing a per-row query; callers opt in with selectinload.
+    modules = relationship(
+        "Module",
+        back_populates="skill",
+        order_by="Module.order_index",
+        lazy="raise",
+    )
+
+
+class Module(Base):
+    __tablename__ = "modules"
+    # The covering index serves list_modules_for_subject as an
+    # index-only scan on Postgres: the key matches the filter + keyset
+    # order and INCLUDE carries the listed columns, so no heap fetch per
+    # row. Partial, because reads never want deleted rows. SQLite
+    # ignores the INCLUDE list and keeps the partial composite key.
+    __table_args__ = (
+        Index(
+            "ix_module_subject_order",
+            "subject_id",
+            "order_index",
+            "id",
+            postgresql_include=["slug", "title", "description"],
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        _search_trgm_index("ix_module_search_trgm", "title", "slug"),
+        _slug_pattern_index("ix_module_slug_pattern"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(Integer, primary_key=True)
+    subject_id = Column(Integer, ForeignKey("subjects.id"), nullable=True)
+    skill_id = Column(Integer, ForeignKey("skills.id"), nullable=True)
+    slug = Column(String(128), unique=True, nullable=False, index=True)
+    title = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+    order_index = Column(Integer, default=0, nullable=False)
+    is_deleted = Column(Boolean, default=False, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    skill = relationship("Skill", back_populates="modules", lazy="raise")
+    subject = relationship(
+        "Subject", back_populates="modules", foreign_keys=[subject_id]
+    )
+    lessons = relationship(
+        "Lesson",
+        back_populates="module",
+        order_by="Lesson.order_index",
+        lazy="noload",
+    )
+
+
+class Lesson(Base):
+    __tablename__ = "lessons"
+    # Serves both the next-lesson lookup and list_lessons_for_module;
+    # the id tail matches the keyset order and INCLUDE covers the list
+    # projection (content stays in the heap — it is never listed).
+    __table_args__ = (
+        Index(
+            "ix_lesson_module_order",
+            "module_id",
+            "order_index",
+            "id",
+            postgresql_include=["slug", "title"],
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        _search_trgm_index("ix_lesson_search_trgm", "title", "slug"),
+        _slug_pattern_index("ix_lesson_slug_pattern"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(Integer, primary_key=True)
+    module_id = Column(Integer, ForeignKey("modules.id"), nullable=True)
+    slug = Column(String(128), unique=True, nullable=False, index=True)
+    title = Column(String(255), nullable=False)
+    content = Column(Text, nullable=True)
+    order_index = Column(Integer, default=0, nullable=False)
+    is_deleted = Column(Boolean, default=False, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    module = relationship("Module", back_populates="lessons")
+    activities = relationship(
+        "Activity",
+        back_populates="lesson",
+        order_by="Activity.order_index",
+        lazy="noload",
+    )
+
+
+class Activity(Base):
+    __tablename__ = "activities"
+    # get_lesson_quiz and list_activities filter (lesson_id, type) and
+    # order by (order_index, id); id in the key makes it a covering sort
+    # and INCLUDE(title) lets the list projection skip the heap.
+    __table_args__ = (
+        Index(
+            "ix_activity_lesson_type_order",
+            "lesson_id",
+            "type",
+            "order_index",
+            "id",
+            postgresql_include=["title"],
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        _search_trgm_index("ix_activity_search_trgm", "title"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(Integer, primary_key=True)
+    lesson_id = Column(Integer, ForeignKey("lessons.id"), nullable=False)
+    title = Column(String(255), nullable=False)
+    type = Column(SmallInteger, default=int(ActivityType.CONTENT), nullable=False)
+    order_index = Column(Integer, default=0, nullable=False)
+    content = Column(Text, nullable=True)
+    quiz_questions = Column(JSON, nullable=True)
+    # The same questions pre-serialized with orjson at generation time;
+    # reads splice these bytes straight into the response instead of
+    # JSON-decoding the column and re-encoding on the way out.
+    quiz_questions_json = Column(LargeBinary, nullable=True)
+    quiz_pass_score = Column(Integer, nullable=True)
+    # Correct option indices packed as one int8 per question, precomputed
+    # at generation time so grading is a vectorized compare.
+    answer_key = Column(LargeBinary, nullable=True)
+    # Deterministic fingerprint of the generation inputs; lets repeat
+    # quiz generations return the stored row instead of calling OpenAI.
+    cache_key = Column(String(64), unique=True, nullable=True, index=True)
+    # Embedding of the source lesson content (list of floats; JSON keeps
+    # it portable across sqlite/Postgres without pgvector).
+    quiz_embedding = Column(JSON, nullable=True)
+    is_deleted = Column(Boolean, default=False, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    lesson = relationship("Lesson", back_populates="activities")
+
+
+class Progress(Base):
+    __tablename__ = "progress"
+    # One state row per (user, lesson, activity) target; the COALESCE
+    # expressions fold NULL refs into the key (both engines treat bare
+    # NULLs as distinct, which would allow duplicates). Writers address
+    # the row with ON CONFLICT on this index.
+    # The second index matches list_progress exactly — filter on user_id,
+    # order by (updated_at DESC, id DESC) — and INCLUDE carries the rest
+    # of the projection, so the page is an index-only scan on Postgres
+    # with no filesort. Progress rows are never soft-deleted, so there is
+    # no partial predicate here.
+    __table_args__ = (
+        Index(
+            "uq_progress_user_target",
+            "user_id",
+            text("coalesce(lesson_id, 0)"),
+            text("coalesce(activity_id, 0)"),
+            unique=True,
+        ),
+        Index(
+            "ix_progress_user_updated",
+            "user_id",
+            text("updated_at DESC"),
+            text("id DESC"),
+            postgresql_include=[
+                "lesson_id",
+                "activity_id",
+                "status",
+                "score",
+                "created_at",
+            ],
+        ),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(String(128), nullable=False, index=True)
+    lesson_id = Column(Integer, ForeignKey("lessons.id"), nullable=True)
+    activity_id = Column(Integer, ForeignKey("activities.id"), nullable=True)
+    status = Column(String(32), default="in_progress", nullable=False)
+    score = Column(Float, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
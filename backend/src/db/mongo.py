@@ -0,0 +1,47 @@
+"""MongoDB connection management (Motor async client)."""
+
+import os
+from typing import Optional
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+_client: Optional[AsyncIOMotorClient] = None
+
+
+async def init_mongo() -> None:
+    """Create the shared Motor client and verify the connection."""
+    global _client
+    if _client is None:
+        _client = AsyncIOMotorClient(
+            os.getenv("MONGODB_URI", "mongodb://localhost:27017"),
+            # The default pool caps concurrent in-flight queries well
+            # below what the async handlers can issue; min keeps warm
+            # connections through idle spells.
+            maxPoolSize=int(os.getenv("MONGO_POOL_MAX", "100")),
+            minPoolSize=int(os.getenv("MONGO_POOL_MIN", "10")),
+            # Wire compression pays off on lesson content (markdown)
+            # documents; the server picks the first codec it supports
+            # and plain zlib is always available.
+            compressors="zstd,snappy,zlib",
+            zlibCompressionLevel=3,
+            # Fail over in seconds, not the 30s default, so a dead
+            # primary degrades the catalog instead of hanging requests.
+            serverSelectionTimeoutMS=3000,
+            retryWrites=True,
+            uuidRepresentation="standard",
+        )
+
+
+async def close_mongo() -> None:
+    """Close the shared Motor client if it was created."""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+
+
+def get_mongo_db() -> AsyncIOMotorDatabase:
+    """Return the application database; init_mongo must have run first."""
+    if _client is None:
+        raise RuntimeError("Mongo client is not initialized; call init_mongo() first")
+    return _client[os.getenv("MONGODB_DB", "skillmaster")]
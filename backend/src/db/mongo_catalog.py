@@ -0,0 +1,91 @@
+"""Mongo-backed repository for the skills/lessons catalog."""
+
+from typing import Any, Dict, List, Optional
+
+
+def _strip_id(doc: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if doc is not None:
+        doc.pop("_id", None)
+    return doc
+
+
+class MongoCatalogRepository:
+    """CRUD over the ``skills`` and ``lessons`` collections."""
+
+    def __init__(self, db) -> None:
+        self._skills = db["skills"]
+        self._lessons = db["lessons"]
+
+    async def ensure_indexes(self) -> None:
+        await self._skills.create_index("slug", unique=True)
+        await self._lessons.create_index("slug", unique=True)
+        await self._lessons.create_index("skillSlug")
+
+    # -- skills ----------------------------------------------------------
+
+    async def list_skills(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        query: Dict[str, Any] = {}
+        if category:
+            query["categorySlug"] = category
+        docs = await self._skills.find(query).sort("name", 1).to_list(length=None)
+        return [_strip_id(d) for d in docs]
+
+    async def count_skills(self, category: Optional[str] = None) -> int:
+        query: Dict[str, Any] = {}
+        if category:
+            query["categorySlug"] = category
+        return await self._skills.count_documents(query)
+
+    async def iter_skills(
+        self,
+        category: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ):
+        """Yield skill docs one batch at a time instead of materializing."""
+        query: Dict[str, Any] = {}
+        if category:
+            query["categorySlug"] = category
+        cursor = self._skills.find(query).sort("name", 1).skip(skip)
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        async for doc in cursor:
+            yield _strip_id(doc)
+
+    async def get_skill(self, slug: str) -> Optional[Dict[str, Any]]:
+        return _strip_id(await self._skills.find_one({"slug": slug}))
+
+    async def upsert_skill(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        await self._skills.update_one({"slug": doc["slug"]}, {"$set": doc}, upsert=True)
+        return doc
+
+    async def update_skill(self, slug: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        result = await self._skills.update_one({"slug": slug}, {"$set": updates})
+        if result.matched_count == 0:
+            return None
+        return await self.get_skill(slug)
+
+    # -- lessons ---------------------------------------------------------
+
+    async def list_lessons_for_skill(self, skill_slug: str) -> List[Dict[str, Any]]:
+        docs = (
+            await self._lessons.find({"skillSlug": skill_slug}).sort("order", 1).to_list(length=None)
+        )
+        return [_strip_id(d) for d in docs]
+
+    async def get_lesson(self, slug: str) -> Optional[Dict[str, Any]]:
+        return _strip_id(await self._lessons.find_one({"slug": slug}))
+
+    async def upsert_lesson(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        await self._lessons.update_one({"slug": doc["slug"]}, {"$set": doc}, upsert=True)
+        return doc
+
+    async def update_lesson(self, slug: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        result = await self._lessons.update_one({"slug": slug}, {"$set": updates})
+        if result.matched_count == 0:
+            return None
+        return await self.get_lesson(slug)
+
+    async def delete_lesson(self, slug: str) -> bool:
+        result = await self._lessons.delete_one({"slug": slug})
+        return result.deleted_count > 0
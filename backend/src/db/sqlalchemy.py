@@ -0,0 +1,84 @@
+"""Relational database setup (SQLAlchemy engine, sessions, metadata)."""
+
+import os
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+
+_ASYNC_ENGINE = None
+
+
+def _async_url(url: str) -> str:
+    """Map a sync database URL onto its async driver."""
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+
+# SQLite ships with foreign keys off; the API relies on the constraint
+# firing (writes map FK violations to 400 instead of pre-checking the
+# parent), so turn it on per connection.
+def _enable_sqlite_fks(dbapi_conn, _record) -> None:
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def get_async_engine():
+    """Return the shared async engine, creating it on first use.
+
+    Async handlers await their queries here instead of blocking the
+    event loop inside a sync Session (which serializes all traffic and
+    produces pool-timeout lockups under load).
+    """
+    global _ASYNC_ENGINE
+    if _ASYNC_ENGINE is None:
+        url = _async_url(
+            os.getenv("SQLALCHEMY_DATABASE_URL", "sqlite:///./skillmaster.db")
+        )
+        kwargs = {}
+        if not url.startswith("sqlite"):
+            # The default QueuePool of 5 serializes requests under load;
+            # size the pool for concurrent handlers, drop stale
+            # connections (pre_ping) and recycle hourly to stay inside
+            # server-side idle timeouts.
+            kwargs.update(
+                pool_size=20,
+                max_overflow=20,
+                pool_pre_ping=True,
+                pool_recycle=3600,
+            )
+        _ASYNC_ENGINE = create_async_engine(url, **kwargs)
+        if url.startswith("sqlite"):
+            event.listen(_ASYNC_ENGINE.sync_engine, "connect", _enable_sqlite_fks)
+    return _ASYNC_ENGINE
+
+
+def get_async_session_factory():
+    """Return an AsyncSession factory bound to the shared async engine."""
+    return async_sessionmaker(
+        bind=get_async_engine(), autoflush=False, expire_on_commit=False
+    )
+
+
+async def create_all_tables() -> None:
+    """Create any tables registered on the shared metadata.
+
+    Runs on the async engine — the only drivers shipped are asyncpg and
+    aiosqlite, so a sync engine could not even connect to Postgres.
+    """
+    from sqlalchemy import text
+
+    from . import models  # noqa: F401 - registers tables on Base.metadata
+
+    engine = get_async_engine()
+    async with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            # The trigram search indexes in models.py need pg_trgm;
+            # create it before the tables so create_all can build them.
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.create_all)
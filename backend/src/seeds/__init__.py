@@ -0,0 +1,10 @@
+"""Seed runners for initial application data."""
+
+import asyncio
+
+
+def run_all_seeds() -> None:
+    """Run every seed script. Safe to call repeatedly; seeds are idempotent."""
+    from .seed_skills import seed
+
+    asyncio.run(seed())
@@ -0,0 +1,168 @@
+"""Seed the MongoDB catalog with the initial set of skills and lessons.
+
+Idempotent: every document is upserted by slug, so the script can be run
+repeatedly (e.g. on every deploy) without creating duplicates.
+
+Run directly with ``python -m src.seeds.seed_skills``.
+"""
+
+import asyncio
+import functools
+import os
+import re
+from datetime import datetime, timezone
+
+from pymongo import AsyncMongoClient, UpdateOne
+
+MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
+MONGODB_DB = os.getenv("MONGODB_DB", "skillmaster")
+
+# category -> list of (name, level, description, [lesson titles])
+SEED_DATA = {
+    "Programming": [
+        ("Python Basics", "Beginner", "Core Python syntax, data types and control flow.",
+         ["Getting Started with Python", "Variables and Types"]),
+        ("JavaScript Essentials", "Beginner", "The language of the web, from values to functions.",
+         ["Introduction to JavaScript"]),
+        ("SQL Fundamentals", "Beginner", "Querying relational databases with SELECT, JOIN and GROUP BY.",
+         ["Your First Queries"]),
+    ],
+    "Data Science": [
+        ("Data Analysis with Pandas", "Intermediate", "Loading, cleaning and reshaping tabular data.",
+         ["DataFrames and Series"]),
+        ("Statistics Refresher", "Beginner", "Descriptive statistics and distributions in practice.",
+         ["Mean, Median and Mode"]),
+        ("Machine Learning Intro", "Intermediate", "Supervised learning concepts and a first model.",
+         ["What is a Model?"]),
+    ],
+    "Design": [
+        ("UI Design Principles", "Beginner", "Layout, hierarchy, contrast and spacing.",
+         ["Visual Hierarchy"]),
+        ("Figma Workflow", "Beginner", "Frames, components and prototyping in Figma.",
+         ["Frames and Components"]),
+        ("Design Systems", "Advanced", "Tokens, component libraries and governance.",
+         ["Why Design Systems?"]),
+    ],
+    "Languages": [
+        ("Spanish for Beginners", "Beginner", "Greetings, essential phrases and pronunciation.",
+         ["Greetings and Introductions"]),
+        ("French for Beginners", "Beginner", "Everyday vocabulary and basic grammar.",
+         ["Bonjour: First Words"]),
+        ("Japanese Kana", "Beginner", "Reading and writing hiragana and katakana.",
+         ["Hiragana Basics"]),
+    ],
+    "Music": [
+        ("Guitar Fundamentals", "Beginner", "Open chords, strumming and simple songs.",
+         ["Holding the Guitar"]),
+        ("Music Theory 101", "Beginner", "Notes, scales, intervals and keys.",
+         ["The Major Scale"]),
+        ("Piano Starter", "Beginner", "Posture, hand position and first melodies.",
+         ["Finding Middle C"]),
+    ],
+    "Business": [
+        ("Public Speaking", "Intermediate", "Structure, delivery and handling nerves.",
+         ["Structuring a Talk"]),
+        ("Personal Finance", "Beginner", "Budgeting, saving and compound interest.",
+         ["Building a Budget"]),
+        ("Project Management Basics", "Beginner", "Scope, schedules and stakeholders.",
+         ["The Project Lifecycle"]),
+    ],
+}
+
+
+_SLUG_STRIP = re.compile(r"[^a-z0-9\s\-]")
+_SLUG_SPACES = re.compile(r"\s+")
+_SLUG_DASHES = re.compile(r"-{2,}")
+
+
+@functools.lru_cache(maxsize=256)
+def slugify(text: str) -> str:
+    """Turn an arbitrary title into a URL-safe slug."""
+    text = _SLUG_STRIP.sub("", text.strip().lower())
+    text = _SLUG_SPACES.sub("-", text)
+    return _SLUG_DASHES.sub("-", text).strip("-")
+
+
+async def seed() -> dict:
+    """Upsert all seed skills and lessons, returning per-collection counts."""
+    client = AsyncMongoClient(MONGODB_URI)
+    try:
+        db = client[MONGODB_DB]
+        skills = db["skills"]
+        lessons = db["lessons"]
+
+        now = datetime.now(timezone.utc)
+        # Invariants hoisted out of the loop: one timestamp for the whole
+        # run and one slugify per category instead of per skill.
+        category_slugs = {cat: slugify(cat) for cat in SEED_DATA}
+        skill_ops = []
+        lesson_ops = []
+        for category, entries in SEED_DATA.items():
+            category_slug = category_slugs[category]
+            for name, level, description, lesson_titles in entries:
+                slug = slugify(name)
+                skill_doc = {
+                    "name": name,
+                    "slug": slug,
+                    "category": category,
+                    "categorySlug": category_slug,
+                    "level": level,
+                    "description": description,
+                    "tags": [category_slug, level.lower()],
+                    "updatedAt": now,
+                }
+                skill_ops.append(
+                    UpdateOne(
+                        {"slug": slug},
+                        {"$setOnInsert": {"createdAt": now}, "$set": skill_doc},
+                        upsert=True,
+                    )
+                )
+                for order, title in enumerate(lesson_titles, start=1):
+                    lesson_slug = slugify(f"{name} {title}")
+                    lesson_doc = {
+                        "title": title,
+                        "slug": lesson_slug,
+                        "skillSlug": slug,
+                        "order": order,
+                        "content": f"# {title}\n\nLesson content for {name}.",
+                        "tags": [category_slug],
+                        "updatedAt": now,
+                    }
+                    lesson_ops.append(
+                        UpdateOne(
+                            {"slug": lesson_slug},
+                            {"$setOnInsert": {"createdAt": now}, "$set": lesson_doc},
+                            upsert=True,
+                        )
+                    )
+
+        # One round-trip per collection instead of one per document; the two
+        # bulk writes are independent so they run concurrently.
+        skills_res, lessons_res = await asyncio.gather(
+            skills.bulk_write(skill_ops, ordered=False),
+            lessons.bulk_write(lesson_ops, ordered=False),
+        )
+        await asyncio.gather(
+            skills.create_index("slug", unique=True),
+            lessons.create_index("slug", unique=True),
+            lessons.create_index("skillSlug"),
+        )
+        summary = {
+            "skills": {
+                "inserted": skills_res.upserted_count,
+                "updated": skills_res.modified_count,
+            },
+            "lessons": {
+                "inserted": lessons_res.upserted_count,
+                "updated": lessons_res.modified_count,
+            },
+        }
+        print(f"Seed complete: {summary}")
+        return summary
+    finally:
+        await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(seed())
@@ -0,0 +1 @@
+"""Application services (AI generation, background jobs)."""
@@ -0,0 +1,134 @@
+"""OpenAI-backed quiz generation for lesson activities.
+
+The openai package is optional: without it (or without OPENAI_API_KEY)
+the generator raises ApplicationError and the AI endpoints degrade to
+503 instead of breaking the rest of the app.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from ..api.errors import ApplicationError, ErrorCode
+
+try:
+    from openai import AsyncOpenAI
+except ImportError:  # pragma: no cover - optional dependency
+    AsyncOpenAI = None
+
+_SYSTEM_PROMPT = (
+    "You write multiple-choice quizzes for an online learning platform. "
+    "Respond with a JSON object {\"questions\": [...]} where each question "
+    "has 'question', 'options' (a list of strings) and 'answerIndex' "
+    "(0-based index of the correct option). No prose outside the JSON."
+)
+
+
+class OpenAIQuizGenerator:
+    """Generates quiz question lists from lesson content."""
+
+    def __init__(self, model: Optional[str] = None) -> None:
+        self._model = model or os.getenv("OPENAI_QUIZ_MODEL", "gpt-4o-mini")
+        self._client = None
+
+    def _get_client(self):
+        if AsyncOpenAI is None or not os.getenv("OPENAI_API_KEY"):
+            raise ApplicationError(
+                "Quiz generation is not configured",
+                code=ErrorCode.INTERNAL_ERROR,
+                status_code=503,
+            )
+        if self._client is None:
+            self._client = AsyncOpenAI()
+        return self._client
+
+    async def embed(self, text: str) -> List[float]:
+        """Embed lesson content for similarity lookups."""
+        client = self._get_client()
+        response = await client.embeddings.create(
+            model=os.getenv("OPENAI_EMBED_MODEL", "text-embedding-3-small"),
+            input=text[:2000],
+        )
+        return response.data[0].embedding
+
+    async def generate_quiz(
+        self,
+        title: str,
+        content: str,
+        difficulty: str = "medium",
+        num_questions: int = 3,
+    ) -> List[Dict[str, Any]]:
+        client = self._get_client()
+        prompt = (
+            f"Write {num_questions} {difficulty} questions about the lesson "
+            f"'{title}'.\n\nLesson content:\n{content[:4000]}"
+        )
+        response = await client.chat.completions.create(
+            model=self._model,
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            response_format={"type": "json_object"},
+        )
+        try:
+            payload = json.loads(response.choices[0].message.content)
+            questions = payload["questions"]
+        except (KeyError, ValueError, TypeError):
+            raise ApplicationError(
+                "Quiz generation returned malformed output",
+                code=ErrorCode.INTERNAL_ERROR,
+                status_code=502,
+            )
+        return questions
+
+    async def generate_quiz_batch(
+        self,
+        lessons: List[Dict[str, str]],
+        difficulty: str = "medium",
+        num_questions: int = 3,
+        prompt_cache_key: Optional[str] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Generate quizzes for several lessons in one model call.
+
+        ``lessons`` is a list of {"title": ..., "content": ...}; the
+        reply is one question list per lesson, in input order. Batching
+        amortizes the request overhead and lets the provider cache the
+        shared system preamble across calls keyed by
+        ``prompt_cache_key``.
+        """
+        client = self._get_client()
+        sections = "\n\n".join(
+            f"### Lesson {i + 1}: {lesson['title']}\n{(lesson.get('content') or '')[:2000]}"
+            for i, lesson in enumerate(lessons)
+        )
+        prompt = (
+            f"Write {num_questions} {difficulty} questions for EACH of the "
+            f"{len(lessons)} lessons below. Respond with a JSON object "
+            '{"quizzes": [[...], [...], ...]} holding one question list per '
+            f"lesson, in the same order.\n\n{sections}"
+        )
+        extra: Dict[str, Any] = {}
+        if prompt_cache_key is not None:
+            extra["prompt_cache_key"] = prompt_cache_key
+        response = await client.chat.completions.create(
+            model=self._model,
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            response_format={"type": "json_object"},
+            **extra,
+        )
+        try:
+            payload = json.loads(response.choices[0].message.content)
+            quizzes = payload["quizzes"]
+            if len(quizzes) != len(lessons):
+                raise ValueError("quiz count mismatch")
+        except (KeyError, ValueError, TypeError):
+            raise ApplicationError(
+                "Quiz generation returned malformed output",
+                code=ErrorCode.INTERNAL_ERROR,
+                status_code=502,
+            )
+        return quizzes